@@ -0,0 +1,128 @@
+"""OpenAI-compatible chat client for the builder's AI copy generator.
+
+One pooled requests.Session per client, connect/read timeouts,
+exponential backoff on 429/5xx (honouring Retry-After), a disk cache
+keyed on (endpoint, model, prompt) and server-sent-event streaming so
+callers can show text as it arrives. Any OpenAI-compatible base URL
+works, including a local fake server for testing.
+"""
+import os
+import re
+import json
+import time
+import random
+import hashlib
+
+DEFAULT_BASE_URL = "https://api.groq.com/openai/v1"
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "titan-ai")
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# Longest server-requested Retry-After honoured; the UI thread blocks while waiting
+MAX_RETRY_AFTER = 10.0
+
+
+class AIError(Exception):
+    pass
+
+
+class AIClient:
+    def __init__(self, api_key, base_url=DEFAULT_BASE_URL, model=DEFAULT_MODEL, timeout=(5, 60), retries=4, backoff=0.5, cache_dir=CACHE_DIR, session=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.base_url, self.model, self.timeout = base_url.rstrip("/"), model, timeout
+        self.retries, self.backoff, self.cache_dir = retries, backoff, cache_dir
+        self._transient = (requests.ConnectionError, requests.Timeout)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter); session.mount("http://", adapter)
+        self.session = session
+        self.session.headers.update({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
+
+    # --- cache ---
+    def _cache_path(self, prompt, json_mode):
+        key = hashlib.sha256(json.dumps([self.base_url, self.model, prompt, json_mode]).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def cached(self, prompt, json_mode=False):
+        if not self.cache_dir: return None
+        try:
+            with open(self._cache_path(prompt, json_mode), encoding="utf-8") as f: content = json.load(f)["content"]
+        except (OSError, ValueError, KeyError):
+            return None
+        return content if _complete(content, json_mode) else None
+
+    def _store(self, prompt, json_mode, content):
+        if not self.cache_dir: return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(prompt, json_mode)
+        with open(path + ".tmp", "w", encoding="utf-8") as f: json.dump({"model": self.model, "prompt": prompt, "content": content}, f)
+        os.replace(path + ".tmp", path)
+
+    # --- transport ---
+    def _delay(self, attempt, resp=None):
+        retry_after = resp.headers.get("Retry-After") if resp is not None else None
+        if retry_after and retry_after.replace(".", "", 1).isdigit(): return min(float(retry_after), MAX_RETRY_AFTER)
+        return self.backoff * (2 ** attempt) * (1 + random.random() / 4)
+
+    def _post(self, payload, stream):
+        # Retries happen before any token is handed out, so a retried stream never repeats text
+        for attempt in range(self.retries + 1):
+            try:
+                resp = self.session.post(f"{self.base_url}/chat/completions", json=payload, timeout=self.timeout, stream=stream)
+            except self._transient as e:
+                if attempt == self.retries: raise AIError(f"Request failed: {e}") from e
+                time.sleep(self._delay(attempt))
+                continue
+            if resp.status_code in RETRY_STATUS and attempt < self.retries:
+                resp.close()
+                time.sleep(self._delay(attempt, resp))
+                continue
+            if resp.status_code != 200: raise AIError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+            return resp
+
+    def stream_chat(self, prompt, json_mode=False, use_cache=True):
+        # Yields text deltas; a cache hit yields the whole answer at once
+        hit = self.cached(prompt, json_mode) if use_cache else None
+        if hit is not None:
+            yield hit
+            return
+        payload = {"model": self.model, "messages": [{"role": "user", "content": prompt}], "stream": True}
+        if json_mode: payload["response_format"] = {"type": "json_object"}
+        parts, done = [], False
+        with self._post(payload, stream=True) as resp:
+            for line in resp.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"): continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    done = True
+                    break
+                delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        # A cut-off stream (or, in JSON mode, unparseable output) is never cached, so a retry asks again
+        content = "".join(parts)
+        if done and _complete(content, json_mode): self._store(prompt, json_mode, content)
+
+    def chat(self, prompt, json_mode=False, use_cache=True):
+        return "".join(self.stream_chat(prompt, json_mode, use_cache))
+
+
+def _complete(content, json_mode):
+    if not content: return False
+    if not json_mode: return True
+    try: json.loads(content)
+    except ValueError: return False
+    return True
+
+
+def partial_fields(text, keys):
+    # Best-effort read of string fields from a JSON object that is still streaming in
+    out = {}
+    for key in keys:
+        m = re.search(rf'"{re.escape(key)}"\s*:\s*"((?:[^"\\]|\\.)*)', text)
+        if m:
+            try: out[key] = json.loads(f'"{m.group(1).rstrip(chr(92))}"')
+            except ValueError: out[key] = m.group(1)
+    return out
@@ -0,0 +1,108 @@
+"""Deterministic, incremental ZIP writer for the site download.
+
+Entries are written straight to the output stream with fixed timestamps
+and permissions, so identical inputs give byte-identical archives.
+Compressed payloads live in a content-addressed BuildCache keyed on a
+digest of the input bytes: a rebuild only deflates files that changed,
+misses are deflated in parallel, and already-compressed formats (.gz,
+.br, woff2, images) are stored as-is. Archives past 65535 entries or
+4 GiB get ZIP64 end records.
+"""
+import os
+import time
+import zlib
+import struct
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import profiler
+
+STORED_TYPES = (".gz", ".br", ".woff2", ".webp", ".avif", ".jpg", ".jpeg", ".png", ".gif", ".zip")
+DEFLATE_LEVEL = 6
+# 1980-01-01 00:00:00, the earliest DOS timestamp
+DOS_TIME, DOS_DATE = 0, (1 << 5) | 1
+UNIX_FILE = 0o100644 << 16
+
+
+class BuildCache:
+    # LRU bounded by payload bytes; edits simply miss and stale entries age out
+    def __init__(self, max_bytes=256 << 20):
+        self.max_bytes, self.size, self.entries = max_bytes, 0, OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if key in self.entries: return
+        self.entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            self.size -= len(self.entries.popitem(last=False)[1])
+
+
+def digest(raw):
+    return hashlib.sha256(raw).digest()
+
+
+def deflate(raw):
+    z = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+    return z.compress(raw) + z.flush()
+
+
+def _payloads(entries, cache, workers):
+    # entries: [(path, raw)]; returns [(method, payload)] in the same order
+    keys = [None if not raw or path.lower().endswith(STORED_TYPES) else ("deflate", digest(raw)) for path, raw in entries]
+    packed, todo = {}, {}
+    for key, (path, raw) in zip(keys, entries):
+        if key is None or key in packed or key in todo: continue
+        hit = cache.get(key) if cache is not None else None
+        if hit is not None: packed[key] = hit
+        else: todo[key] = raw
+    if todo:
+        # zlib releases the GIL, so threads are enough to use every core
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+            for key, data in zip(todo, pool.map(deflate, todo.values())):
+                packed[key] = data
+                if cache is not None: cache.put(key, data)
+    # Incompressible data is stored: smaller archive, and no inflate on extract
+    return [(8, packed[key]) if key and len(packed[key]) < len(raw) else (0, raw) for key, (path, raw) in zip(keys, entries)]
+
+
+def write_zip(files, fileobj, cache=None, workers=None):
+    entries = [(path, data.encode("utf-8") if isinstance(data, str) else data) for path, data in files.items()]
+    central, offset, profile = [], 0, profiler.current()
+    with profiler.stage("zip.deflate"): payloads = _payloads(entries, cache, workers)
+    for (path, raw), (method, payload) in zip(entries, payloads):
+        started = time.perf_counter()
+        name = path.encode("utf-8")
+        flags = 0 if name.isascii() else 0x800
+        crc = zlib.crc32(raw)
+        if max(len(raw), len(payload)) > 0xFFFFFFFF: raise ValueError(f"{path}: a single file over 4 GiB cannot be archived")
+        fields = (20, flags, method, DOS_TIME, DOS_DATE, crc, len(payload), len(raw), len(name), 0)
+        fileobj.write(struct.pack("<IHHHHHIIIHH", 0x04034B50, *fields) + name)
+        fileobj.write(payload)
+        # Past 4 GiB the header offset moves into a ZIP64 extra field
+        extra = struct.pack("<HHQ", 0x0001, 8, offset) if offset >= 0xFFFFFFFF else b""
+        version = 45 if extra else 20
+        central.append(struct.pack("<IHH", 0x02014B50, (3 << 8) | version, version) + struct.pack("<HHHHIIIHH", *fields[1:-1], len(extra))
+                       + struct.pack("<HHHII", 0, 0, 0, UNIX_FILE, min(offset, 0xFFFFFFFF)) + name + extra)
+        offset += 30 + len(name) + len(payload)
+        if profile:
+            elapsed = time.perf_counter() - started
+            profile.record("zip.write", elapsed, elapsed, len(payload))
+    directory = b"".join(central)
+    fileobj.write(directory)
+    count, size = len(central), len(directory)
+    if count >= 0xFFFF or max(offset, size) >= 0xFFFFFFFF:
+        # ZIP64 end record and locator; the classic record below then carries only sentinels
+        fileobj.write(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, (3 << 8) | 45, 45, 0, 0, count, count, size, offset))
+        fileobj.write(struct.pack("<IIQI", 0x07064B50, 0, offset + size, 1))
+        count, size, offset = min(count, 0xFFFF), min(size, 0xFFFFFFFF), min(offset, 0xFFFFFFFF)
+    fileobj.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, size, offset, 0))
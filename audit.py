@@ -0,0 +1,152 @@
+"""Offline performance-budget audit of the built site.
+
+Runs over the file map the ZIP is written from, with no browser and no
+network. Per page it reports transfer weight (the page plus the local
+CSS/JS/images/fonts it references, at their smallest precompressed size),
+render-blocking resources in <head>, third-party origins, the byte share
+of inline SVG/CSS/JS, DOM node count and images that are unsized (no
+width/height and no inline aspect-ratio) or not lazy-loaded. Unsized
+remote images, which the build never downloaded and so cannot measure,
+are counted apart as unmeasured_images and have no budget by default.
+audit_site() checks each page against BUDGETS.
+"""
+import re
+import posixpath
+import urllib.parse
+from html.parser import HTMLParser
+
+# None disables a budget; transfer weight is in KB (1000 bytes)
+BUDGETS = {
+    "transfer_kb": 250, "render_blocking": 2, "third_party_origins": 5, "dom_nodes": 1500,
+    "unsized_images": 0, "unmeasured_images": None, "eager_images": 1, "inline_share": None,
+}
+RESOURCE_RELS = {"stylesheet", "preload", "modulepreload", "icon", "apple-touch-icon", "manifest"}
+CSS_URL = re.compile(r'url\(\s*[\'"]?(https?://[^\'")\s]+)')
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, violations):
+        super().__init__(f"{len(violations)} performance budget(s) exceeded")
+        self.violations = violations
+
+
+class _PageScan(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes, self.in_head, self.base = 0, False, ""
+        self.blocking, self.resources, self.remote = [], [], set()
+        self.unsized, self.unmeasured, self.eager = [], [], []
+        self.inline = {"css": 0, "js": 0}
+        self._inline, self._noscript = None, 0
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes += 1
+        a = {k: v or "" for k, v in attrs}
+        if a.get("style"): self.inline["css"] += len(a["style"].encode("utf-8"))
+        if tag == "head": self.in_head = True
+        elif tag == "body": self.in_head = False
+        elif tag == "base": self.base = a.get("href", "")
+        elif tag in ("noscript", "template"): self._noscript += 1
+        # <noscript> fallbacks only load when scripting is off; <template> (embed facades) until swapped in
+        if self._noscript: return
+        src, href = a.get("src", ""), a.get("href", "")
+        if tag == "script":
+            if src:
+                self.resources.append(src)
+                if self.in_head and "async" not in a and "defer" not in a and a.get("type") != "module": self.blocking.append(src)
+            elif a.get("type", "text/javascript") in ("text/javascript", "module", "application/ld+json"): self._inline = "js"
+        elif tag == "style": self._inline = "css"
+        elif tag == "link":
+            rels = set(a.get("rel", "").lower().split())
+            if rels & RESOURCE_RELS: self.resources.append(href)
+            # onload-swapped preloads and print/non-matching media never block first paint
+            if self.in_head and "stylesheet" in rels and a.get("media", "all") in ("all", "screen", ""): self.blocking.append(href)
+            if rels & {"preconnect", "dns-prefetch"}: self.remote.add(href)
+        elif tag in ("img", "iframe", "video", "audio", "source", "embed"):
+            if src: self.resources.append(src)
+            for candidate in a.get("srcset", "").split(","):
+                url = candidate.split()[0] if candidate.strip() else ""
+                if "://" in url: self.remote.add(url)
+            if tag == "img":
+                label = src or a.get("alt", "img")
+                # An inline aspect-ratio reserves the box just as width/height attributes do
+                if not (a.get("width") and a.get("height")) and "aspect-ratio" not in a.get("style", ""):
+                    (self.unmeasured if _origin(src) or src.startswith("//") else self.unsized).append(label)
+                if a.get("loading") != "lazy" and a.get("fetchpriority") != "high": self.eager.append(label)
+            if tag == "iframe" and a.get("loading") != "lazy": self.eager.append(src)
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"): self._inline = None
+        elif tag in ("noscript", "template"): self._noscript = max(0, self._noscript - 1)
+        elif tag == "head": self.in_head = False
+
+    def handle_data(self, data):
+        if self._inline:
+            self.inline[self._inline] += len(data.encode("utf-8"))
+            if self._inline == "css": self.remote.update(CSS_URL.findall(data))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+
+def _svg_bytes(markup):
+    # Whole elements, tags included: the parser only sees SVG as separate nodes
+    return sum(len(m.encode("utf-8")) for m in re.findall(r'<svg\b.*?</svg>', markup, re.S | re.I))
+
+
+def _origin(url):
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
+
+def transfer_size(files, path):
+    # What a static host serves: the smallest of the file and its precompressed siblings
+    sizes = [len(d.encode("utf-8") if isinstance(d, str) else d) for d in (files.get(path), files.get(path + ".gz"), files.get(path + ".br")) if d is not None]
+    return min(sizes) if sizes else 0
+
+
+def audit_page(path, markup, files, site_origin=""):
+    scan = _PageScan()
+    scan.feed(markup)
+    scan.close()
+    root = posixpath.normpath(posixpath.join(posixpath.dirname(path), scan.base or "."))
+    local, origins = set(), set()
+    for ref in scan.resources + list(scan.remote):
+        origin = _origin(ref)
+        if origin:
+            if origin != site_origin: origins.add(origin)
+        elif ref and not ref.startswith(("data:", "#", "mailto:", "tel:")):
+            local.add(posixpath.normpath(posixpath.join(root, urllib.parse.urlsplit(ref).path)).lstrip("/"))
+    size = len(markup.encode("utf-8"))
+    inline = {**scan.inline, "svg": _svg_bytes(markup)}
+    return {
+        "page": path, "transfer_kb": round((transfer_size(files, path) + sum(transfer_size(files, p) for p in local)) / 1000, 1),
+        "render_blocking": len(scan.blocking), "third_party_origins": len(origins), "dom_nodes": scan.nodes,
+        "unsized_images": len(scan.unsized), "unmeasured_images": len(scan.unmeasured), "eager_images": len(scan.eager),
+        "inline_svg": round(inline["svg"] / size, 3), "inline_css": round(inline["css"] / size, 3), "inline_js": round(inline["js"] / size, 3),
+        "inline_share": round(sum(inline.values()) / size, 3), "origins": sorted(origins),
+    }
+
+
+def audit_site(files, budgets=None, site_origin=""):
+    # Returns (rows, violations); budgets override BUDGETS key by key
+    budgets = {**BUDGETS, **(budgets or {})}
+    unknown = sorted(set(budgets) - set(BUDGETS))
+    if unknown: raise ValueError(f"Unknown budget keys: {', '.join(unknown)}")
+    origin = _origin(site_origin) or ""
+    rows, violations = [], []
+    for path, data in files.items():
+        if not path.endswith(".html") or isinstance(data, bytes): continue
+        row = audit_page(path, data, files, origin)
+        rows.append(row)
+        for key, limit in budgets.items():
+            if limit is not None and row[key] > limit:
+                violations.append(f"{path}: {key} {row[key]} > budget {limit}")
+    return rows, violations
+
+
+def format_audit(rows):
+    lines = [f"{'page':36} {'KB':>7} {'block':>5} {'3p':>3} {'nodes':>6} {'unsized':>7} {'eager':>5} {'inline':>6}"]
+    for r in rows:
+        lines.append(f"{r['page'][:36]:36} {r['transfer_kb']:>7} {r['render_blocking']:>5} {r['third_party_origins']:>3} {r['dom_nodes']:>6} {r['unsized_images']:>7} {r['eager_images']:>5} {r['inline_share']:>6.1%}")
+    return "\n".join(lines)
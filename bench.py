@@ -0,0 +1,176 @@
+"""Compiler benchmarks over synthetic sites.
+
+    python bench.py [--sizes 10,100,1000] [--baseline bench-baseline.json] [--save [--portable]] [--check]
+
+Each size n builds a site with n features, FAQ lines, testimonials,
+products and posts (the Store and Blog CSVs are served from a local HTTP
+server) and records the full-ZIP build time, a warm rebuild with the
+section and compression caches the UI keeps, peak traced memory and the
+ZIP size. zip_bytes and files leave out the .gz/.br sidecars, whose
+presence depends on whether brotli is installed. Against a stored
+baseline, any metric that regresses past its tolerance makes the run
+exit non-zero; with --check, so does a missing baseline or a size it
+has no entry for. Times are machine-specific: save the baseline on the
+machine that compares against it. The committed bench-baseline.json was
+saved with --portable, so it only gates zip_bytes and files; that is
+what `python bench.py --check` checks anywhere. Larger sizes (10000
+builds some 60,000 files) can be passed with --sizes.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import archive
+import engine
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_BASELINE = "bench-baseline.json"
+# Relative growth allowed over the baseline before a metric counts as a regression
+TOLERANCE = {"build_s": 0.25, "rebuild_s": 0.25, "peak_mb": 0.15, "zip_bytes": 0.05}
+# Metrics that do not depend on the machine, the only ones --portable saves
+PORTABLE = ("zip_bytes", "files")
+ICONS = ("bolt", "wallet", "table", "shield", "layers", "star")
+
+
+def _csv(rows):
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def fixture_sheets(n):
+    store = [["Name", "Price", "Description", "Image", "Link"]] + [[f"Product {i}", f"${10 + i % 90}.{i % 100:02d}", f"Item {i}, with a quoted \"spec\" and a comma.", "", ""] for i in range(n)]
+    blog = [["id", "title", "date", "category", "summary", "image", "content"]] + [
+        [f"post-{i}", f"Post {i}", f"2026-01-{1 + i % 28:02d}", ("News", "Guides", "Updates")[i % 3], f"Summary of post {i}.", "", f"Intro **{i}**\n* point a\n* point b\nClosing line."] for i in range(n)]
+    return {"/store.csv": _csv(store), "/blog.csv": _csv(blog)}
+
+
+def fixture_config(n, base_url):
+    return engine.make_config({
+        "feat_data": "\n".join(f"{ICONS[i % len(ICONS)]} | Feature {i} | **Benefit {i}**. Description of feature {i}." for i in range(n)),
+        "faq_data": "\n".join(f"Question {i}? ? Answer {i}." for i in range(n)),
+        "testi_data": "\n".join(f"Client {i} | Quote number {i}." for i in range(n)),
+        "sheet_url": f"{base_url}/store.csv", "blog_sheet_url": f"{base_url}/blog.csv",
+    })
+
+
+class _Sheets(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.server.sheets.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(sheets):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Sheets)
+    server.sheets = sheets
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _sidecars(files):
+    # Precompressed siblings: .br only exists with the optional brotli package
+    return [path for path in files if path.endswith((".gz", ".br")) and path[:-3] in files]
+
+
+def build_zip(c, cache=None):
+    # The full download path: compile, then stream the archive to a temp file
+    result = engine.compile_site(c, cache=cache)
+    with tempfile.TemporaryFile() as f:
+        engine.write_zip(result["files"], f, cache=cache)
+        size = f.tell()
+    # Sidecars are stored as-is: a local header and a central record (30 + 46 fixed bytes, the name twice) plus the data
+    sidecars = _sidecars(result["files"])
+    size -= sum(76 + 2 * len(path.encode("utf-8")) + len(result["files"][path]) for path in sidecars)
+    return size, len(result["files"]) - len(sidecars)
+
+
+def bench_size(n, repeat=3):
+    server = serve(fixture_sheets(n))
+    try:
+        c = fixture_config(n, f"http://127.0.0.1:{server.server_port}")
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            zip_size, file_count = build_zip(c)
+            timings.append(time.perf_counter() - started)
+        # Warm rebuild: the section and compression caches the Streamlit session keeps between clicks
+        build_cache = archive.BuildCache()
+        with engine.section_cache(OrderedDict()):
+            build_zip(c, build_cache)
+            started = time.perf_counter()
+            build_zip(c, build_cache)
+            rebuild = time.perf_counter() - started
+        # Traced separately: tracemalloc slows the build it measures
+        tracemalloc.start()
+        try:
+            build_zip(c)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        server.shutdown()
+    return {"build_s": round(min(timings), 4), "rebuild_s": round(rebuild, 4), "peak_mb": round(peak / 2**20, 2), "zip_bytes": zip_size, "files": file_count}
+
+
+def compare(results, baseline, tolerance=TOLERANCE, strict=False):
+    failures = []
+    for size, metrics in results.items():
+        if strict and size not in baseline:
+            failures.append(f"n={size}: no baseline entry; run with --save to record one")
+            continue
+        for key, limit in tolerance.items():
+            base = baseline.get(size, {}).get(key)
+            if base and metrics[key] > base * (1 + limit):
+                failures.append(f"n={size} {key}: {metrics[key]} vs baseline {base} (+{metrics[key] / base - 1:.0%}, limit +{limit:.0%})")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bench", description="Titan compiler benchmarks")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated site sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="cold builds per size (best time is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--portable", action="store_true", help="with --save, keep only machine-independent metrics")
+    parser.add_argument("--check", action="store_true", help="fail when there is no baseline to compare against")
+    for key, limit in TOLERANCE.items():
+        parser.add_argument(f"--max-{key.replace('_', '-')}", type=float, default=limit, dest=key, help=f"allowed {key} growth (default {limit:.0%})")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'n':>6} {'files':>6} {'build s':>9} {'rebuild s':>10} {'peak MB':>9} {'zip bytes':>11}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        m = results[str(n)] = bench_size(n, args.repeat)
+        print(f"{n:>6} {m['files']:>6} {m['build_s']:>9.3f} {m['rebuild_s']:>10.3f} {m['peak_mb']:>9.2f} {m['zip_bytes']:>11}")
+    if args.save:
+        if args.portable: results = {size: {k: m[k] for k in PORTABLE} for size, m in results.items()}
+        with open(args.baseline, "w") as f: json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to create one", file=sys.stderr if args.check else sys.stdout)
+        return 1 if args.check else 0
+    with open(args.baseline) as f: baseline = json.load(f)
+    failures = compare(results, baseline, {key: getattr(args, key) for key in TOLERANCE}, strict=args.check)
+    for line in failures: print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1595 @@
+"""Titan compiler: turns a site config into the static files of the website ZIP.
+
+Pure Python with no Streamlit import, so the Streamlit UI (app.py) and the
+headless CLI (titan.py) produce byte-identical output from the same config.
+"""
+import io
+import os
+import re
+import csv
+import json
+import html
+import hashlib
+import time
+import tomllib
+import contextlib
+import contextvars
+import urllib.parse
+from types import SimpleNamespace
+from collections import OrderedDict
+
+import archive
+import audit
+import fonts
+import images
+import optimize
+import profiler
+import search
+
+# --- 0. SITE CONFIG ---
+# One key per builder widget; app.py uses these as its widget defaults.
+DEFAULT_CONFIG = {
+    # Identity & PWA
+    "biz_name": "StopWebRent.com", "biz_tagline": "Stop Renting. Start Owning.", "biz_phone": "966572562151",
+    "biz_email": "hello@kaydiemscriptlab.com", "prod_url": "https://www.stopwebrent.com",
+    "biz_addr": "Kaydiem Script Lab\nKolkata, India", "map_iframe": "", "seo_d": "Stop paying monthly fees for Wix.",
+    "logo_url": "", "pwa_short": None, "pwa_desc": "Official App", "pwa_icon": None, "lang_sheet": "",
+    "fb_link": "", "ig_link": "", "x_link": "", "li_link": "", "yt_link": "", "wa_num": "966572562151",
+    # Content blocks
+    "hero_h": "Stop Paying Rent for Your Website.",
+    "hero_sub": "The Titan Engine is the world’s first 0.1s website architecture that runs on $0 monthly fees. Pay once. Own it forever.",
+    "hero_video_id": "",
+    "hero_img_1": "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=1600",
+    "hero_img_2": "https://images.unsplash.com/photo-1551288049-bebda4e38f71?q=80&w=1600",
+    "hero_img_3": "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?q=80&w=1600",
+    "stat_1": "0.1s", "label_1": "Speed", "stat_2": "$0", "label_2": "Fees", "stat_3": "100%", "label_3": "Ownership",
+    "f_title": "Value Pillars",
+    "feat_data": "bolt | The Performance Pillar | **0.1s High-Velocity Loading**. While traditional sites take 3–5s, Titan loads instantly.\nwallet | The Economic Pillar | **$0 Monthly Fees**. We eliminated hosting subscriptions.\ntable | The Functional Pillar | **Google Sheets CMS**. Update prices and photos directly from a simple spreadsheet.\nshield | The Authority Pillar | **Unhackable Security**. Zero-DB Architecture removes the hacker's primary entry point.\nlayers | The Reliability Pillar | **Global Edge Deployment**. Distributed across 100+ servers worldwide.\nstar | The Conversion Pillar | **One-Tap WhatsApp**. Direct-to-Chat technology.",
+    "about_h": "Control Your Empire from a Spreadsheet",
+    "about_img": "https://images.unsplash.com/photo-1543286386-713df548e9cc?q=80&w=1600",
+    "about_short": "No WordPress dashboard. No plugins to update. Just open your private Google Sheet, change a text, and watch your site update globally in seconds.",
+    "about_long": "The Digital Landlord Trap...",
+    # Marketing
+    "top_bar_enabled": False, "top_bar_text": "🔥 50% OFF Launch Sale - Ends Soon!", "top_bar_link": "#pricing",
+    "popup_enabled": False, "popup_delay": 5, "popup_title": "Wait! Don't leave empty handed.",
+    "popup_text": "Get our free pricing guide on WhatsApp.", "popup_cta": "Get it Now",
+    # Pricing
+    "titan_price": "$199", "titan_mo": "$0", "wix_name": "Wix", "wix_mo": "$29/mo", "save_val": "$1,466",
+    # Store
+    "sheet_url": "", "custom_feat": "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=800",
+    "prerender_store": True, "live_store": False, "paypal_link": "https://paypal.me/yourid", "upi_id": "name@upi",
+    # Booking
+    "booking_embed": '<!-- Calendly inline widget begin -->\n<div class="calendly-inline-widget" data-url="https://calendly.com/titan-demo/30min" style="min-width:320px;height:630px;"></div>\n<script type="text/javascript" src="https://assets.calendly.com/assets/external/widget.js" async></script>\n<!-- Calendly inline widget end -->',
+    "booking_title": "Book an Appointment", "booking_desc": "Select a time slot.",
+    # Blog
+    "blog_sheet_url": "", "blog_hero_title": "Latest Insights", "blog_hero_sub": "Thoughts on tech.",
+    "prerender_blog": True, "live_blog": False,
+    # Legal
+    "testi_data": "Rajesh Gupta | Titan stopped the bleeding.\nSarah Jenkins | Easy updates.",
+    "faq_data": "Do I pay $0? ? Yes.\nIs it secure? ? Yes.",
+    "priv_txt": "We collect minimum data.", "term_txt": "You own the code.",
+    # Design studio
+    "theme_mode": "Clean Corporate (Light)", "p_color": "#0F172A", "s_color": "#EF4444", "hero_layout": "Center",
+    "btn_style": "Rounded (Default)", "anim_type": "Fade Up", "h_font": "Montserrat", "b_font": "Inter",
+    # Section manager
+    "show_hero": True, "show_stats": True, "show_features": True, "show_pricing": True, "show_inventory": True,
+    "show_blog": True, "show_gallery": True, "show_testimonials": True, "show_faq": True, "show_cta": True, "show_booking": True,
+    "show_search": True,
+    # Performance
+    "optimize_images": False, "self_host_fonts": False, "critical_css": True, "minify": True, "precompress": True,
+    "build_report": False, "audit": "Warn", "budgets": {},
+    # SEO & analytics
+    "seo_area": "Global / Online", "seo_kw": "web design, no monthly fees", "gsc_tag": "", "ga_tag": "", "og_image": "",
+}
+
+BUTTON_RADII = {"Sharp (Square)": "0px", "Pill (Full Round)": "50px"}
+DEFAULT_LANG = "en"
+
+def make_config(values=None):
+    values = dict(values or {})
+    unknown = sorted(set(values) - set(DEFAULT_CONFIG))
+    if unknown: raise ValueError(f"Unknown config keys: {', '.join(unknown)}")
+    cfg = {**DEFAULT_CONFIG, **values}
+    if cfg["pwa_short"] is None: cfg["pwa_short"] = cfg["biz_name"][:12]
+    if cfg["pwa_icon"] is None: cfg["pwa_icon"] = cfg["logo_url"]
+    cfg["border_rad"] = BUTTON_RADII.get(cfg["btn_style"], "8px")
+    cfg["images"], cfg["fonts"] = {}, None
+    return SimpleNamespace(**cfg)
+
+def with_build_data(c, **data):
+    # Build-time derived inputs (e.g. the optimized image map) ride along on a copy of the config
+    return SimpleNamespace(**{**vars(c), **data})
+
+def config_values(c):
+    return {k: getattr(c, k) for k in DEFAULT_CONFIG}
+
+def load_config(path):
+    with open(path, "rb") as f:
+        values = tomllib.load(f) if str(path).endswith(".toml") else json.load(f)
+    return make_config(values)
+
+# --- 1. SECTION CACHE ---
+SECTION_CACHE_SIZE = 256
+_section_cache = contextvars.ContextVar("section_cache", default=None)
+
+@contextlib.contextmanager
+def section_cache(cache):
+    token = _section_cache.set(cache)
+    try: yield cache
+    finally: _section_cache.reset(token)
+
+SECTIONS = {}
+
+def memo_section(*inputs):
+    # LRU per caller-supplied cache: a generator re-renders only when its own config inputs or arguments change.
+    # The declared inputs double as the component registry (SECTIONS: name -> config keys).
+    def wrap(fn):
+        SECTIONS[fn.__name__] = inputs
+        def cached(c, *args, **kwargs):
+            cache = _section_cache.get()
+            if cache is None: return fn(c, *args, **kwargs)
+            key = hashlib.sha256(repr((fn.__name__, args, sorted(kwargs.items()), [getattr(c, n) for n in inputs])).encode()).hexdigest()
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            out = fn(c, *args, **kwargs)
+            cache[key] = out
+            while len(cache) > SECTION_CACHE_SIZE: cache.popitem(last=False)
+            return out
+        cached.__name__ = fn.__name__
+        return cached
+    return wrap
+
+# --- 2. COMPILER ENGINE ---
+
+def format_text(text):
+    if not text: return ""
+    processed_text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
+    lines = processed_text.split('\n')
+    html_out = ""
+    in_list = False
+    for line in lines:
+        clean_line = line.strip()
+        if not clean_line: continue
+        if clean_line.startswith("* "):
+            if not in_list: html_out += '<ul style="margin-bottom:1rem; padding-left:1.5rem;">'; in_list = True
+            content = clean_line[2:] 
+            html_out += f'<li style="margin-bottom:0.5rem; opacity:0.9; color:inherit;">{content}</li>'
+        else:
+            if in_list: html_out += "</ul>"; in_list = False
+            html_out += f"<p style='margin-bottom:1rem; opacity:0.9; color:inherit;'>{clean_line}</p>"
+    if in_list: html_out += "</ul>"
+    return html_out
+
+def slugify(text):
+    return re.sub(r'[^a-z0-9]+', '-', str(text).lower()).strip('-') or "item"
+
+def fetch_csv_rows(url, header=False):
+    # One build-time download; same trimming as the client-side csvParser
+    import requests
+    resp = requests.get(url, timeout=20)
+    resp.raise_for_status()
+    resp.encoding = 'utf-8'
+    rows = list(csv.reader(io.StringIO(resp.text)))[0 if header else 1:]
+    return [[cell.strip() for cell in r] for r in rows if any(cell.strip() for cell in r)]
+
+@memo_section("biz_name", "logo_url", "hero_img_1", "biz_phone", "biz_email", "prod_url", "seo_d")
+def gen_schema(c):
+    schema = {
+        "@context": "https://schema.org", "@type": "LocalBusiness",
+        "name": c.biz_name, "image": c.logo_url or c.hero_img_1,
+        "telephone": c.biz_phone, "email": c.biz_email, "url": c.prod_url, "description": c.seo_d
+    }
+    return f'<script type="application/ld+json">{json.dumps(schema)}</script>'
+
+def gen_pwa_manifest(c):
+    return json.dumps({
+        "name": c.biz_name, "short_name": c.pwa_short, "start_url": "./index.html",
+        "display": "standalone", "background_color": "#ffffff", "theme_color": c.p_color,
+        "description": c.pwa_desc, "icons": [{"src": c.pwa_icon, "sizes": "512x512", "type": "image/png"}]
+    })
+
+def gen_sw(c, files):
+    # Built from the final file map: the cache name changes with any content, so a redeploy swaps caches atomically
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.encode()); digest.update(files[path] if isinstance(files[path], bytes) else files[path].encode())
+    version = digest.hexdigest()[:10]
+    # Images stay out of the precache (only one srcset variant is ever used); they are cached on first fetch
+    precache = ["./"] + [f"./{p}" for p in files if p.endswith(".html") or p.startswith(("assets/", "fonts/")) or p == "manifest.json"]
+    sheets = [url for url in dict.fromkeys((c.sheet_url, c.blog_sheet_url)) if url]
+    data_cache = f"titan-data-{hashlib.sha256(repr(sheets).encode()).hexdigest()[:10]}"
+    return f"""
+    const CACHE = 'titan-{version}', DATA_CACHE = '{data_cache}';
+    const PRECACHE = {json.dumps(precache)};
+    const SHEETS = {json.dumps(sheets)};
+    self.addEventListener('install', (e) => {{ e.waitUntil(caches.open(CACHE).then((cache) => cache.addAll(PRECACHE)).then(() => self.skipWaiting())); }});
+    self.addEventListener('activate', (e) => {{
+        e.waitUntil(caches.keys().then((keys) => Promise.all(keys.filter((k) => k !== CACHE && k !== DATA_CACHE).map((k) => caches.delete(k)))).then(() => self.clients.claim()));
+    }});
+    // Sheet CSVs: answer from cache instantly, refresh it in the background
+    function staleWhileRevalidate(e) {{
+        return caches.open(DATA_CACHE).then((cache) => cache.match(e.request).then((hit) => {{
+            const update = fetch(e.request).then((res) => {{ if (res.ok) cache.put(e.request, res.clone()); return res; }});
+            if (hit) {{ e.waitUntil(update.catch(() => {{}})); return hit; }}
+            return update;
+        }}));
+    }}
+    self.addEventListener('fetch', (e) => {{
+        if (e.request.method !== 'GET') return;
+        if (SHEETS.includes(e.request.url)) {{ e.respondWith(staleWhileRevalidate(e)); return; }}
+        if (new URL(e.request.url).origin !== location.origin) return;
+        // product.html?item=... and post.html?id=... share one precached page
+        e.respondWith(caches.match(e.request, {{ ignoreSearch: e.request.mode === 'navigate' }}).then((hit) => hit || fetch(e.request).then((res) => {{
+            if (res.ok) {{ const copy = res.clone(); caches.open(CACHE).then((cache) => cache.put(e.request, copy)); }}
+            return res;
+        }})));
+    }});
+    """
+
+@memo_section("theme_mode", "anim_type", "hero_layout", "p_color", "s_color", "border_rad", "h_font", "b_font")
+def theme_css_blocks(c):
+    # Ordered cascade blocks: the full, critical and deferred stylesheets are all cut from these
+    bg_color, text_color, card_bg, glass_nav = "#ffffff", "#0f172a", "#ffffff", "rgba(255, 255, 255, 0.95)"
+    
+    if "Midnight" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#0f172a", "#f8fafc", "#1e293b", "rgba(15, 23, 42, 0.9)"
+    elif "Cyberpunk" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#050505", "#00ff9d", "#111", "rgba(0,0,0,0.8)"
+    elif "Luxury" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#1c1c1c", "#D4AF37", "#2a2a2a", "rgba(28,28,28,0.95)"
+    elif "Forest" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#f1f8e9", "#1b5e20", "#ffffff", "rgba(241,248,233,0.9)"
+    elif "Ocean" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#e0f7fa", "#006064", "#ffffff", "rgba(224,247,250,0.9)"
+    elif "Stark" in c.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#ffffff", "#000000", "#ffffff", "rgba(255,255,255,1)"
+
+    anim_css = ""
+    if c.anim_type == "Fade Up":
+        anim_css = ".reveal { opacity: 0; transform: translateY(30px); transition: all 0.8s ease-out; } .reveal.active { opacity: 1; transform: translateY(0); }"
+    elif c.anim_type == "Zoom In":
+        anim_css = ".reveal { opacity: 0; transform: scale(0.95); transition: all 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.275); } .reveal.active { opacity: 1; transform: scale(1); }"
+    # Honour the OS setting even before the runtime script has run
+    anim_css += " @media (prefers-reduced-motion: reduce) { .reveal { opacity: 1; transform: none; transition: none; } .carousel-slide { transition: none; } .hero-content { animation: none; } html { scroll-behavior: auto; } }"
+    
+    hero_align = "text-align: center; justify-content: center;"
+    if c.hero_layout == "Left":
+        hero_align = "text-align: left; justify-content: flex-start; align-items: center;"
+
+    hero_css = f"""
+    .hero {{ position: relative; min-height: 90vh; overflow: hidden; display: flex; {hero_align} color: white; padding-top: 80px; background-color: var(--p); }}
+    .carousel-slide {{ position: absolute; top: 0; left: 0; width: 100%; height: 100%; background-size: cover; background-position: center; opacity: 0; transition: opacity 1.5s ease-in-out; z-index: 0; }}
+    .carousel-slide.active {{ opacity: 1; }}
+    .carousel-slide picture, .carousel-slide img {{ display: block; width: 100%; height: 100%; object-fit: cover; }}
+    .hero-overlay {{ background: rgba(0,0,0,0.5); position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1; }}
+    .hero-content {{ z-index: 2; position: relative; animation: slideUp 1s ease-out; width: 100%; padding: 0 20px; }}
+    @keyframes slideUp {{ from {{ opacity:0; transform: translateY(30px); }} to {{ opacity:1; transform: translateY(0); }} }}
+    """
+
+    extra_css = """
+    #cart-float { position: fixed; bottom: 100px; right: 30px; background: var(--p); color: white; padding: 15px 20px; border-radius: 50px; box-shadow: 0 10px 20px rgba(0,0,0,0.2); cursor: pointer; z-index: 998; display: flex; align-items: center; gap: 10px; font-weight: bold; }
+    #cart-modal { display: none; position: fixed; top: 50%; left: 50%; transform: translate(-50%, -50%); background: var(--card); width: 90%; max-width: 500px; padding: 2rem; border-radius: 16px; box-shadow: 0 20px 50px rgba(0,0,0,0.3); z-index: 1001; border: 1px solid rgba(128,128,128,0.2); color: var(--txt); }
+    #cart-overlay { display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000; }
+    .cart-item { display: flex; justify-content: space-between; border-bottom: 1px solid #eee; padding: 10px 0; }
+    
+    .share-row { display: flex; gap: 10px; margin-top: 20px; flex-wrap: wrap; }
+    .share-label { font-weight: bold; margin-right: 5px; font-size: 0.9rem; align-self: center; }
+    .share-btn { width: 40px; height: 40px; display: flex; align-items: center; justify-content: center; border-radius: 50%; color: white; transition: 0.3s; border: none; cursor: pointer; text-decoration: none; }
+    .share-btn:hover { transform: translateY(-3px); filter: brightness(1.1); }
+    .share-btn svg { width: 20px; height: 20px; fill: white; }
+    
+    /* Social Brand Colors */
+    .bg-fb { background: #1877F2; } .bg-x { background: #000000; } .bg-li { background: #0A66C2; } 
+    .bg-wa { background: #25D366; } .bg-rd { background: #FF4500; } .bg-link { background: #64748b; }
+    
+    #top-bar { position: fixed; top: 0; width: 100%; background: var(--s); color: white; text-align: center; padding: 10px; z-index: 1002; font-weight: bold; font-size: 0.9rem; transition: transform 0.3s; }
+    #top-bar a { color: white; text-decoration: underline; }
+    
+    #lead-popup { display: none; position: fixed; top: 50%; left: 50%; transform: translate(-50%, -50%); background: var(--card); padding: 3rem; text-align: center; border-radius: var(--radius); z-index: 2000; box-shadow: 0 25px 100px rgba(0,0,0,0.5); width: 90%; max-width: 450px; border: 1px solid rgba(0,0,0,0.1); color: var(--txt); }
+    .close-popup { position: absolute; top: 15px; right: 15px; cursor: pointer; font-size: 1.5rem; opacity: 0.5; }
+    
+    #theme-toggle { position: fixed; bottom: 30px; left: 30px; width: 40px; height: 40px; background: var(--card); border-radius: 50%; display: flex; align-items: center; justify-content: center; box-shadow: 0 5px 15px rgba(0,0,0,0.1); cursor: pointer; z-index: 999; font-size: 1.2rem; border: 1px solid rgba(0,0,0,0.1); }
+    """
+
+    base = f"""
+    :root {{
+        --p: {c.p_color}; --s: {c.s_color}; --bg: {bg_color}; --txt: {text_color}; --card: {card_bg};
+        --radius: {c.border_rad}; --nav: {glass_nav};
+        --h-font: '{c.h_font}', sans-serif; --b-font: '{c.b_font}', sans-serif;
+    }}
+    * {{ box-sizing: border-box; }}
+    html {{ scroll-behavior: smooth; font-size: 16px; }}
+    body {{ background-color: var(--bg); color: var(--txt); font-family: var(--b-font); margin: 0; line-height: 1.6; overflow-x: hidden; }}
+    
+    body.dark-mode {{ --bg: #0f172a; --txt: #f8fafc; --card: #1e293b; --nav: rgba(15, 23, 42, 0.95); }}
+    
+    p, h1, h2, h3, h4, h5, h6, span, li, div {{ color: inherit; }}
+    .legal-text {{ color: var(--txt) !important; }}
+    
+    h1, h2, h3, h4 {{ font-family: var(--h-font); color: var(--p); line-height: 1.2; margin-bottom: 1rem; }}
+    strong {{ color: var(--p); font-weight: 800; }}
+    
+    h1 {{ font-size: clamp(2.5rem, 5vw, 4.5rem); }}
+    h2 {{ font-size: clamp(2rem, 4vw, 3rem); }}
+    
+    /* FORCE HERO TEXT WHITE */
+    .hero h1 {{ color: #ffffff !important; text-shadow: 0 4px 20px rgba(0,0,0,0.4); }}
+    .hero p {{ color: rgba(255,255,255,0.95) !important; font-size: clamp(1.1rem, 2vw, 1.3rem); max-width: 700px; margin: 0 auto 2rem auto; text-shadow: 0 2px 10px rgba(0,0,0,0.4); }}
+    
+    input, textarea, select {{ width: 100%; padding: 0.8rem; margin-bottom: 1rem; border: 1px solid #ccc; border-radius: 6px; font-family: inherit; }}
+    label {{ color: var(--txt); font-weight: bold; margin-bottom: 0.5rem; display: block; }}
+
+    .container {{ max-width: 1280px; margin: 0 auto; padding: 0 20px; }}
+    
+    /* BUTTON UI FIX */
+    .btn {{ 
+        display: inline-flex; align-items: center; justify-content: center;
+        padding: 1rem 2rem; border-radius: var(--radius); 
+        font-weight: 700; text-decoration: none; transition: 0.3s; 
+        text-transform: uppercase; cursor: pointer; border: none; text-align: center;
+        white-space: normal; /* Allow wrap */
+        line-height: 1.4; min-height: 3.5rem; 
+        word-wrap: break-word; overflow-wrap: break-word; hyphens: auto;
+    }}
+    .btn-primary {{ background: var(--p); color: white !important; }}
+    .btn-accent {{ background: var(--s); color: white !important; box-shadow: 0 10px 25px -5px var(--s); }}
+    .btn:hover {{ transform: translateY(-3px); filter: brightness(1.15); }}
+    
+    nav {{ position: fixed; top: 0; width: 100%; z-index: 1000; background: var(--nav); backdrop-filter: blur(12px); border-bottom: 1px solid rgba(100,100,100,0.1); padding: 1rem 0; transition: top 0.3s; }}
+    .nav-flex {{ display: flex; justify-content: space-between; align-items: center; }}
+    .nav-links {{ display: flex; align-items: center; }}
+    .nav-links a {{ margin-left: 2rem; text-decoration: none; font-weight: 600; color: var(--txt); font-size: 0.9rem; opacity: 0.8; transition:0.2s; }}
+    .nav-links a:hover {{ opacity: 1; color: var(--s); }}
+    .mobile-menu {{ display: none; font-size: 1.5rem; cursor: pointer; }}
+    .nav-search {{ position: relative; margin-left: 2rem; }}
+    .nav-search input {{ width: 180px; margin: 0; padding: 0.45rem 0.9rem; border-radius: 50px; font-size: 0.9rem; background: var(--card); color: var(--txt); }}
+    #search-results {{ display: none; position: absolute; top: calc(100% + 8px); right: 0; width: min(360px, 90vw); max-height: 60vh; overflow-y: auto; background: var(--card); border: 1px solid rgba(100,100,100,0.15); border-radius: 12px; box-shadow: 0 20px 40px -10px rgba(0,0,0,0.2); z-index: 1003; }}
+    #search-results a {{ display: block; margin: 0; padding: 0.7rem 1rem; opacity: 1; font-size: 0.9rem; border-bottom: 1px solid rgba(100,100,100,0.08); }}
+    #search-results small {{ display: block; font-weight: 400; opacity: 0.7; }}
+    
+    """
+    layout = """
+    /* REDUCED PADDING SECTION */
+    section { padding: clamp(2rem, 5vw, 4rem) 0; }
+    .section-head { text-align: center; margin-bottom: clamp(1.5rem, 4vw, 3rem); }
+    
+    .grid-3 { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; }
+    .about-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: center; }
+    .contact-grid { display: grid; grid-template-columns: 1fr 2fr; gap: 3rem; }
+    .detail-view { display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: start; }
+    
+    .card { background: var(--card); padding: 2rem; border-radius: var(--radius); border: 1px solid rgba(100,100,100,0.1); transition: 0.3s; height: 100%; display: flex; flex-direction: column; }
+    .card:hover { transform: translateY(-5px); box-shadow: 0 20px 40px -10px rgba(0,0,0,0.1); border-color: var(--s); }
+    .card h1, .card h2, .card h3, .card h4, .card h5, .card h6, .card a { color: var(--txt) !important; text-decoration: none; }
+    .card p { color: var(--txt); opacity: 0.9; }
+    
+    picture.prod-img { display: block; padding: 0; overflow: hidden; }
+    picture.prod-img img { width: 100%; height: 100%; object-fit: cover; }
+    .prod-img { width: 100%; height: 250px; object-fit: cover; border-radius: calc(var(--radius) - 4px); margin-bottom: 1.5rem; background: #f1f5f9; }
+    
+    .pricing-wrapper { overflow-x: auto; margin: 2rem 0; -webkit-overflow-scrolling: touch; padding-bottom: 1rem; }
+    .pricing-table { width: 100%; border-collapse: collapse; min-width: 600px; }
+    .pricing-table th { background: var(--p); color: white; padding: 1.5rem; text-align: left; font-size: 1.1rem; }
+    .pricing-table td { padding: 1.5rem; border-bottom: 1px solid rgba(100,100,100,0.1); background: var(--card); color: var(--txt); }
+    .pricing-table tr:last-child td { font-weight: bold; font-size: 1.2rem; background: rgba(var(--s), 0.1); border-bottom: none; }
+
+    details { background: var(--card); border: 1px solid rgba(100,100,100,0.1); border-radius: 8px; margin-bottom: 1rem; padding: 1rem; cursor: pointer; color: var(--txt); }
+    details summary { font-weight: bold; font-size: 1.1rem; color: var(--txt); }
+    details p { margin-top: 1rem; margin-bottom: 0; opacity: 0.9; color: var(--txt); }
+
+    footer { background: var(--p); color: white; padding: 4rem 0; margin-top: auto; }
+    .footer-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 3rem; }
+    footer a { color: rgba(255,255,255,0.8) !important; text-decoration: none; display: block; margin-bottom: 0.5rem; transition: 0.3s; }
+    footer a:hover { color: #ffffff !important; text-decoration: underline; }
+    .social-icon { width: 24px; height: 24px; fill: rgba(255,255,255,0.7); transition: 0.3s; }
+    .social-icon:hover { fill: #ffffff; transform: scale(1.1); }
+
+    /* Off-screen cards skip layout and paint until scrolled near */
+    #inv-grid > .card, #blog-grid > .card { content-visibility: auto; contain-intrinsic-size: auto 480px; }
+
+    .blog-badge { background: var(--s); color: white; padding: 0.3rem 0.8rem; border-radius: 50px; font-size: 0.75rem; text-transform: uppercase; font-weight: bold; width: fit-content; margin-bottom: 1rem; display:inline-block; }
+
+    /* Third-party embeds wait behind a placeholder until clicked or scrolled near */
+    .facade { position: relative; display: flex; flex-direction: column; align-items: center; justify-content: center; gap: 1rem; padding: 2rem; background: var(--card); color: var(--txt); cursor: pointer; }
+    .facade-btn { background: var(--p); color: white; border: none; border-radius: var(--radius); padding: 0.8rem 1.6rem; font-weight: bold; cursor: pointer; }
+    .facade.facade-loaded { display: block; padding: 0; cursor: auto; }
+    
+    """
+    mobile_top = """
+        .nav-links { 
+            position: fixed; top: 60px; left: -100%; width: 100%; height: calc(100vh - 60px); 
+            background: var(--bg); flex-direction: column; padding: 2rem; transition: 0.3s; 
+            align-items: flex-start; justify-content: flex-start; border-top: 1px solid rgba(0,0,0,0.1); overflow-y: auto; gap: 1.5rem;
+        }
+        .nav-links.active { left: 0; }
+        .nav-links a { margin-left: 0; font-size: 1.2rem; }
+        .mobile-menu { display: block; }
+        .nav-search, .nav-search input { margin-left: 0; width: 100%; }
+        #search-results { position: static; width: 100%; }
+        
+        .hero { min-height: 60vh; padding-top: 100px; }
+        
+        .btn { width: 100%; margin-bottom: 0.5rem; min-height: 3.5rem; }
+        .hero-content .btn { width: auto; }
+        #cart-float { bottom: 110px; right: 20px; }
+        #theme-toggle { bottom: 20px; left: 20px; }
+    """
+    mobile_layout = """
+        .about-grid, .contact-grid, .detail-view, .grid-3 { grid-template-columns: 1fr !important; gap: 2rem; }
+        .about-grid img, .about-grid picture { order: -1; margin-bottom: 1rem; }
+    """
+    return {"base": base, "hero": hero_css, "overlays": extra_css, "layout": layout, "anim": anim_css,
+            "mobile_top": mobile_top, "mobile_layout": mobile_layout}
+
+def _mobile_css(rules):
+    return f"@media (max-width: 768px) {{{rules}}}"
+
+def get_theme_css(c):
+    b = theme_css_blocks(c)
+    return b["base"] + b["hero"] + b["overlays"] + b["layout"] + b["anim"] + _mobile_css(b["mobile_top"] + b["mobile_layout"])
+
+def get_critical_css(c):
+    # Above the fold: palette, typography, nav, hero and the fixed overlays (hidden before first paint)
+    b = theme_css_blocks(c)
+    return b["base"] + b["hero"] + b["overlays"] + b["anim"] + _mobile_css(b["mobile_top"])
+
+def get_deferred_css(c):
+    # Loaded after first paint; anim repeats last so ".card.reveal" keeps the original cascade order
+    b = theme_css_blocks(c)
+    return b["layout"] + b["anim"] + _mobile_css(b["mobile_layout"])
+
+@memo_section("logo_url", "biz_name", "show_blog", "show_booking", "top_bar_enabled", "top_bar_link", "top_bar_text", "show_features", "show_pricing", "show_inventory", "biz_phone", "show_search")
+def gen_nav(c, lang_links=""):
+    logo_display = f'<img src="{c.logo_url}" height="40" alt="{c.biz_name} Logo">' if c.logo_url else f'<span style="font-weight:900; font-size:1.5rem; color:var(--p)" id="nav-logo">{c.biz_name}</span>'
+    blog_link = '<a href="blog.html" onclick="toggleMenu()" id="nav-blog">Blog</a>' if c.show_blog else ''
+    book_link = '<a href="booking.html" onclick="toggleMenu()" id="nav-book">Book Now</a>' if c.show_booking else ''
+    search_box = '<div class="nav-search"><input type="search" id="site-search" placeholder="Search…" aria-label="Search this site" autocomplete="off"><div id="search-results"></div></div>' if c.show_search else ''
+    
+    return f"""
+    {f'<div id="top-bar"><a href="{c.top_bar_link}">{c.top_bar_text}</a></div>' if c.top_bar_enabled else ''}
+    <nav><div class="container nav-flex">
+        <a href="index.html" style="text-decoration:none">{logo_display}</a>
+        <div class="mobile-menu" onclick="document.querySelector('.nav-links').classList.toggle('active')">☰</div>
+        <div class="nav-links">
+            <a href="index.html" onclick="toggleMenu()" id="nav-home">Home</a>
+            {'<a href="index.html#features" onclick="toggleMenu()" id="nav-features">Features</a>' if c.show_features else ''}
+            {'<a href="index.html#pricing" onclick="toggleMenu()" id="nav-pricing">Savings</a>' if c.show_pricing else ''}
+            {'<a href="index.html#inventory" onclick="toggleMenu()" id="nav-store">Store</a>' if c.show_inventory else ''}
+            {blog_link}
+            {book_link}
+            {lang_links}
+            {search_box}
+            <a href="contact.html" onclick="toggleMenu()" id="nav-contact">Contact</a>
+            <a href="tel:{c.biz_phone}" class="btn-accent" style="padding:0.6rem 1.5rem; border-radius:50px; color:white !important;" id="nav-call">Call Now</a>
+        </div>
+    </div></nav>
+    <div id="theme-toggle" onclick="document.body.classList.toggle('dark-mode')">🌓</div>
+    """
+
+def gen_nav_js(c):
+    return f"""
+        function toggleMenu() {{ document.querySelector('.nav-links').classList.remove('active'); }}
+        if({str(c.top_bar_enabled).lower()}) {{
+            document.querySelector('nav').style.top = '40px';
+            if(window.innerWidth <= 768) {{ document.querySelector('.nav-links').style.top = '100px'; }}
+        }}
+    """
+
+def gen_picture(c, url, alt="", cls="", style="", sizes="100vw", eager=False, ratio=None):
+    cls_attr = f' class="{cls}"' if cls else ''
+    loading = ' fetchpriority="high"' if eager else ' loading="lazy"'
+    meta = c.images.get(url)
+    if not meta:
+        # Intrinsic size unknown: fixed-layout slots (ratio) reserve their box and crop, anything else keeps its natural shape
+        if ratio: style = f"aspect-ratio:{ratio}; object-fit:cover; {style}"
+        style_attr = f' style="{style}"' if style else ''
+        return f'<img src="{url}"{cls_attr}{style_attr} alt="{html.escape(alt)}"{loading}>'
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{", ".join(f"{p} {w}w" for p, w in meta[fmt])}" sizes="{sizes}">'
+        for fmt in ("avif", "webp") if meta[fmt]
+    )
+    # The LQIP sits behind the real image until it decodes
+    lqip = f"background:url({meta['lqip']}) center/cover no-repeat; {style}"
+    return f'<picture{cls_attr}>{sources}<img src="{meta["fallback"]}" width="{meta["width"]}" height="{meta["height"]}" style="{lqip}" alt="{html.escape(alt)}"{loading} decoding="async"></picture>'
+
+def embed_height(markup, default):
+    # The embed's own height sizes its placeholder, so swapping it in shifts nothing
+    m = re.search(r'(?<![\w-])height\s*[:=]\s*["\']?(\d+)', markup)
+    return int(m.group(1)) if m else default
+
+def gen_facade(payload, trigger, label="", cls="facade", style="", content=""):
+    # The original embed rides along inert in a <template>; gen_facade_js swaps it in on click, near the viewport ("visible") or once idle
+    style_attr = f' style="{style}"' if style else ''
+    button = f'<button type="button" class="facade-btn">{label}</button>' if label else ''
+    return f'<div class="{cls}" data-facade="{trigger}"{style_attr}><template>{payload}</template>{content}{button}</div>'
+
+def gen_hero_slide(c, url, active=False):
+    cls = "carousel-slide active" if active else "carousel-slide"
+    if url not in c.images: return f"""<div class="{cls}" style="background-image: url('{url}')"></div>"""
+    return f'<div class="{cls}">{gen_picture(c, url, eager=active)}</div>'
+
+@memo_section("hero_img_1", "hero_img_2", "hero_img_3", "hero_video_id", "hero_h", "hero_sub", "hero_layout", "images")
+def gen_hero(c):
+    bg_media = f"""
+    {gen_hero_slide(c, c.hero_img_1, active=True)}
+    {gen_hero_slide(c, c.hero_img_2)}
+    {gen_hero_slide(c, c.hero_img_3)}
+    """
+    
+    if c.hero_video_id:
+        video = f"""
+        <iframe src="https://www.youtube.com/embed/{c.hero_video_id}?autoplay=1&mute=1&loop=1&playlist={c.hero_video_id}&controls=0&showinfo=0&rel=0" 
+        style="position:absolute; top:50%; left:50%; width:100vw; height:100vh; transform:translate(-50%, -50%); pointer-events:none; object-fit:cover; z-index:0; min-width:177.77vh; min-height:56.25vw;" frameborder="0" allow="autoplay; encrypted-media"></iframe>
+        """
+        # The video's own poster frame paints first; the player (and its scripts) arrives once the page is idle
+        bg_media = gen_facade(video, "idle", cls="carousel-slide active", style=f"background-image: url('https://i.ytimg.com/vi/{c.hero_video_id}/hqdefault.jpg')")
+
+    return f"""
+    <section class="hero"{'' if c.hero_video_id else ' data-carousel="4000"'}>
+        <div class="hero-overlay"></div>
+        {bg_media}
+        <div class="container hero-content">
+            <h1 id="hero-title">{c.hero_h}</h1>
+            <p id="hero-sub">{c.hero_sub}</p>
+            <div style="display:flex; gap:1rem; flex-wrap:wrap; {'justify-content:center;' if c.hero_layout == 'Center' else ''}">
+                <a href="#inventory" class="btn btn-accent" id="btn-explore">Explore Now</a>
+                <a href="contact.html" class="btn" style="background:rgba(255,255,255,0.2); backdrop-filter:blur(10px); color:white;" id="btn-contact">Contact Us</a>
+            </div>
+        </div>
+    </section>
+    """
+
+# Shared 24x24 icon paths: features, footer socials, share buttons and the WhatsApp bubble all draw from here
+SVG_PATHS = {
+    "bolt": "M11 21h-1l1-7H7.5c-.58 0-.57-.32-.38-.66.19-.34.05-.08.07-.12C8.48 10.94 10.42 7.54 13 3h1l-1 7h3.5c.49 0 .56.33.47.51l-.07.15C12.96 17.55 11 21 11 21z",
+    "wallet": "M21 18v1c0 1.1-.9 2-2 2H5c-1.11 0-2-.9-2-2V5c0-1.1.89-2 2-2h14c1.1 0 2 .9 2 2v1h-9c-1.11 0-2 .9-2 2v8c0 1.1.89 2 2 2h9zm-9-2h10V8H12v8zm4-2.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5z",
+    "table": "M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zM5 19V5h14v14H5zm2-2h10v-2H7v2zm0-4h10v-2H7v2zm0-4h10V7H7v2z",
+    "shield": "M12 1L3 5v6c0 5.55 3.84 10.74 9 12 5.16-1.26 9-6.45 9-12V5l-9-4zm0 10.99h7c-.53 4.12-3.28 7.79-7 8.94V12H5V6.3l7-3.11v8.8z",
+    "check": "M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z",
+    "whatsapp": "M12.04 2c-5.46 0-9.91 4.45-9.91 9.91c0 1.75.46 3.45 1.32 4.95L2.05 22l5.25-1.38c1.45.79 3.08 1.21 4.74 1.21c5.46 0 9.91-4.45 9.91-9.91c0-2.65-1.03-5.14-2.9-7.01A9.816 9.816 0 0 0 12.04 2m.01 1.67c2.2 0 4.26.86 5.82 2.42a8.225 8.225 0 0 1 2.41 5.83c0 4.54-3.7 8.23-8.24 8.23c-1.48 0-2.93-.39-4.19-1.15l-.3-.17l-3.12.82l.83-3.04l-.2-.32a8.188 8.188 0 0 1-1.26-4.38c.01-4.54 3.7-8.24 8.25-8.24m-3.53 3.16c-.13 0-.35.05-.54.26c-.19.2-.72.7-.72 1.72s.73 2.01.83 2.14c.1.13 1.44 2.19 3.48 3.07c.49.21.87.33 1.16.43c.49.16.94.13 1.29.08c.4-.06 1.21-.5 1.38-.98c.17-.48.17-.89.12-.98c-.05-.09-.18-.13-.37-.23c-.19-.1-.1.13-.1.13s-1.13-.56-1.32-.66c-.19-.1-.32-.15-.45.05c-.13.2-.51.65-.62.78c-.11.13-.23.15-.42.05c-.19-.1-.8-.3-1.53-.94c-.57-.5-1.02-1.12-1.21-1.45c-.11-.19-.01-.29.09-.38c.09-.08.19-.23.29-.34c.1-.11.13-.19.19-.32c.06-.13.03-.24-.01-.34c-.05-.1-.45-1.08-.62-1.48c-.16-.4-.36-.34-.51-.35c-.11-.01-.25-.01-.4-.01Z",
+    "facebook": "M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z",
+    "instagram": "M16.98 0a6.9 6.9 0 0 1 5.08 1.98A6.94 6.94 0 0 1 24 7.02v9.96c0 2.08-.68 3.87-1.98 5.13A7.14 7.14 0 0 1 16.94 24H7.06a7.06 7.06 0 0 1-5.03-1.89A6.96 6.96 0 0 1 0 16.94V7.02C0 2.8 2.8 0 7.02 0h9.96zM7.17 2.1c-1.4 0-2.6.48-3.46 1.33c-.85.85-1.33 2.06-1.33 3.46v10.3c0 1.3.47 2.5 1.33 3.36c.86.85 2.06 1.33 3.46 1.33h9.66c1.4 0 2.6-.48 3.46-1.33c.85-.85 1.33-2.06 1.33-3.46V6.89c0-1.4-.47-2.6-1.33-3.46c-.86-.85-2.06-1.33-3.46-1.33H7.17zm11.97 3.33c.77 0 1.4.63 1.4 1.4c0 .77-.63 1.4-1.4 1.4c-.77 0-1.4-.63-1.4-1.4c0-.77.63-1.4 1.4-1.4zM12 5.76c3.39 0 6.14 2.75 6.14 6.14c0 3.39-2.75 6.14-6.14 6.14c-3.39 0-6.14-2.75-6.14-6.14c0-3.39 2.75-6.14 6.14-6.14zm0 2.1c-2.2 0-3.99 1.79-3.99 4.04c0 2.25 1.79 4.04 3.99 4.04c2.2 0 3.99-1.79 3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04z",
+    "x": "M18.901 1.153h3.68l-8.04 9.19L24 22.846h-7.406l-5.8-7.584l-6.638 7.584H.474l8.6-9.83L0 1.154h7.594l5.243 6.932ZM17.61 20.644h2.039L6.486 3.24H4.298Z",
+    "linkedin": "M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2a2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6zM2 9h4v12H2zM4 2a2 2 0 1 1-2 2a2 2 0 0 1 2-2z",
+    "youtube": "M23.498 6.186a3.016 3.016 0 0 0-2.122-2.136C19.505 3.545 12 3.545 12 3.545s-7.505 0-9.377.505A3.017 3.017 0 0 0 .502 6.186C0 8.07 0 12 0 12s0 3.93.502 5.814a3.016 3.016 0 0 0 2.122 2.136c1.871.505 9.376.505 9.376.505s7.505 0 9.377-.505a3.015 3.015 0 0 0 2.122-2.136C24 15.93 24 12 24 12s0-3.93-.502-5.814zM9.545 15.568V8.432L15.818 12l-6.273 3.568z",
+    "reddit": "M12 0A12 12 0 0 0 0 12a12 12 0 0 0 12 12 12 12 0 0 0 12-12A12 12 0 0 0 12 0zm5.01 4.744c.688 0 1.25.561 1.25 1.249a1.25 1.25 0 0 1-2.498.056l-2.597-.547-.8 3.747c1.824.07 3.48.632 4.674 1.488.308-.309.73-.491 1.207-.491.968 0 1.754.786 1.754 1.754 0 .716-.435 1.333-1.01 1.614a3.111 3.111 0 0 1 .042.52c0 2.694-3.13 4.87-7.004 4.87-3.874 0-7.004-2.176-7.004-4.87 0-.183.015-.366.043-.534A1.748 1.748 0 0 1 4.028 12c0-.968.786-1.754 1.754-1.754.463 0 .898.196 1.207.49 1.207-.883 2.878-1.43 4.744-1.487l.885-4.182a.342.342 0 0 1 .14-.197.35.35 0 0 1 .238-.042l2.906.617a1.214 1.214 0 0 1 1.108-.701zM9.25 12C8.561 12 8 12.562 8 13.25c0 .687.561 1.248 1.25 1.248.687 0 1.248-.561 1.248-1.249 0-.688-.561-1.249-1.249-1.249zm5.5 0c-.687 0-1.248.561-1.248 1.25 0 .687.561 1.248 1.249 1.248.688 0 1.249-.561 1.249-1.249 0-.687-.562-1.249-1.25-1.249zm-5.466 3.99a.327.327 0 0 0-.231.094.33.33 0 0 0 0 .463c.842.842 2.484.913 2.961.913.477 0 2.105-.056 2.961-.913a.361.361 0 0 0 .029-.463.33.33 0 0 0-.464 0c-.547.533-1.684.73-2.512.73-.828 0-1.979-.196-2.512-.73a.326.326 0 0 0-.232-.095z",
+    "link": "M3.9 12c0-1.71 1.39-3.1 3.1-3.1h4V7H7c-2.76 0-5 2.24-5 5s2.24 5 5 5h4v-1.9H7c-1.71 0-3.1-1.39-3.1-3.1zM8 13h8v-2H8v2zm9-6h-4v1.9h4c1.71 0 3.1 1.39 3.1 3.1s-1.39 3.1-3.1 3.1h-4V17h4c2.76 0 5-2.24 5-5s-2.24-5-5-5z",
+}
+
+def svg_icon(name, attrs=""):
+    return f'<svg{attrs} viewBox="0 0 24 24"><path d="{SVG_PATHS[name]}"/></svg>'
+
+def get_simple_icon(name):
+    name = name.lower().strip()
+    return svg_icon(name if name in SVG_PATHS else "check", ' width="32" height="32" fill="currentColor"')
+
+@memo_section("feat_data", "f_title")
+def gen_features(c):
+    cards = ""
+    lines = [x for x in c.feat_data.split('\n') if x.strip()]
+    for line in lines:
+        parts = line.split('|')
+        if len(parts) >= 3:
+            cards += f"""<div class="card reveal"><div style="color:var(--s); margin-bottom:1rem;">{get_simple_icon(parts[0])}</div><h3>{parts[1].strip()}</h3><div>{format_text(parts[2].strip())}</div></div>"""
+    return f"""<section id="features"><div class="container"><div class="section-head reveal"><h2 id="feature-title">{c.f_title}</h2></div><div class="grid-3">{cards}</div></div></section>"""
+
+@memo_section("stat_1", "stat_2", "stat_3", "label_1", "label_2", "label_3")
+def gen_stats(c):
+    return f"""
+    <div style="background:var(--p); color:white; padding:3rem 0; text-align:center;">
+        <div class="container grid-3">
+            <div class="reveal"><h3 style="color:#ffffff; margin:0; font-size:3rem;">{c.stat_1}</h3><p style="color:rgba(255,255,255,0.7);" id="stat-label-1">{c.label_1}</p></div>
+            <div class="reveal"><h3 style="color:#ffffff; margin:0; font-size:3rem;">{c.stat_2}</h3><p style="color:rgba(255,255,255,0.7);" id="stat-label-2">{c.label_2}</p></div>
+            <div class="reveal"><h3 style="color:#ffffff; margin:0; font-size:3rem;">{c.stat_3}</h3><p style="color:rgba(255,255,255,0.7);" id="stat-label-3">{c.label_3}</p></div>
+        </div>
+    </div>
+    """
+
+@memo_section("show_pricing", "wix_name", "titan_price", "titan_mo", "wix_mo", "save_val")
+def gen_pricing_table(c):
+    if not c.show_pricing: return ""
+    return f"""
+    <section id="pricing"><div class="container">
+        <div class="section-head reveal"><h2 id="pricing-title">Pricing</h2></div>
+        <div class="pricing-wrapper reveal">
+            <table class="pricing-table">
+                <thead>
+                    <tr><th style="width:40%" id="col-expense">Expense Category</th><th style="background:var(--s);" id="col-titan">Titan</th><th id="col-comp">{c.wix_name}</th></tr>
+                </thead>
+                <tbody>
+                    <tr><td>Initial Setup Fee</td><td><strong>{c.titan_price}</strong></td><td>$0</td></tr>
+                    <tr><td>Annual Costs</td><td><strong>{c.titan_mo}</strong></td><td>{c.wix_mo}</td></tr>
+                    <tr><td><strong>5-Year Savings</strong></td><td style="color:var(--s); font-size:1.3rem;">You Save {c.save_val}</td><td>$0</td></tr>
+                </tbody>
+            </table>
+        </div>
+    </div></section>
+    """
+
+def gen_csv_parser():
+    return f"<script>{gen_csv_parser_js()}</script>"
+
+def gen_csv_parser_js():
+    # csvParser and sheetTask are plain functions so the same source runs in the Web Worker and on the main thread
+    return """
+    function csvParser(onRow) {
+        // RFC 4180, fed chunk by chunk: quoted fields may hold commas, "" escapes and line breaks
+        let field = '', row = [], quoted = false, quoteSeen = false, skipLF = false;
+        const special = /[",\\r\\n]/g;
+        const endField = () => { row.push(field.trim()); field = ''; };
+        const endRow = () => { endField(); if (row.length > 1 || row[0]) onRow(row); row = []; };
+        function push(text) {
+            let i = 0;
+            while (i < text.length) {
+                if (skipLF) { skipLF = false; if (text[i] === '\\n') { i++; continue; } }
+                if (quoteSeen) { quoteSeen = false; if (text[i] === '"') { field += '"'; i++; continue; } quoted = false; }
+                if (quoted) {
+                    const q = text.indexOf('"', i);
+                    if (q < 0) { field += text.slice(i); return; }
+                    field += text.slice(i, q); i = q + 1; quoteSeen = true; continue;
+                }
+                special.lastIndex = i;
+                const m = special.exec(text);
+                if (!m) { field += text.slice(i); return; }
+                field += text.slice(i, m.index); i = m.index + 1;
+                if (m[0] === '"') { if (field.trim()) field += '"'; else { field = ''; quoted = true; } }
+                else if (m[0] === ',') endField();
+                else { endRow(); skipLF = m[0] === '\\r'; }
+            }
+        }
+        function end() { if (field || row.length || quoteSeen) endRow(); }
+        return { push, end };
+    }
+    async function sheetTask(job, post) {
+        try {
+            const res = await fetch(job.url, { cache: 'no-cache' });
+            if (!res.ok) throw new Error('Sheet ' + res.status);
+            const version = res.headers.get('ETag') || res.headers.get('Last-Modified');
+            if (version && version === job.known) { if (res.body) res.body.cancel(); post({ done: true, version, unchanged: true }); return; }
+            let batch = [], header = true;
+            const parser = csvParser((row) => { if (header) header = false; else batch.push(row); });
+            const flush = () => { if (batch.length) { post({ rows: batch }); batch = []; } };
+            if (res.body && self.TextDecoderStream) {
+                const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+                for (let r = await reader.read(); !r.done; r = await reader.read()) { parser.push(r.value); flush(); }
+            } else parser.push(await res.text());
+            parser.end(); flush();
+            post({ done: true, version });
+        } catch(e) { post({ error: String(e) }); }
+    }
+    function parseMarkdown(text) {
+        if (!text) return '';
+        let html = text.replace(/\\r\\n/g, '\\n').replace(/\\n/g, '<br>').replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>');
+        return html;
+    }
+    """ + gen_util_js() + gen_data_js() + gen_grid_js()
+
+def gen_util_js():
+    # slugify/parsePrice mirror the Python slugify()/parse_price() so client lookups hit build-time keys
+    return """
+    function escapeHTML(s) { return String(s ?? '').replace(/[&<>"']/g, (ch) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' })[ch]); }
+    function slugify(s) { return String(s).toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '') || 'item'; }
+    function parsePrice(s) { return parseFloat(String(s).replace(/[^0-9.]/g, '')) || 0; }
+    """
+
+SHEET_TTL_SECONDS = 300
+
+def gen_data_js():
+    # One fetch per sheet per session: parsed rows live in sessionStorage, stale entries are served and revalidated
+    # in the background. cache:'no-cache' lets the browser send If-None-Match/If-Modified-Since itself, since custom
+    # headers would force a CORS preflight against the Sheets CSV endpoint.
+    return f"""
+    const TitanData = (() => {{
+        const TTL = {SHEET_TTL_SECONDS * 1000}, pending = {{}};
+        let workerUrl;
+        const read = (url) => {{ try {{ return JSON.parse(sessionStorage.getItem('titan:' + url)); }} catch(e) {{ return null; }} }};
+        const write = (url, entry) => {{ try {{ sessionStorage.setItem('titan:' + url, JSON.stringify(entry)); }} catch(e) {{}} }};
+        function stream(url, known, onBatch) {{
+            // Parse off the main thread and hand rows over in batches; fall back to the main thread if workers are unavailable
+            return new Promise((resolve, reject) => {{
+                const all = [], job = {{ url: new URL(url, location.href).href, known }};
+                let worker = null, started = false;
+                const handle = (m) => {{
+                    started = true;
+                    if (m.rows) {{ for (const row of m.rows) all.push(row); if (onBatch) onBatch(m.rows); }}
+                    if (m.error) {{ if (worker) worker.terminate(); reject(new Error(m.error)); }}
+                    if (m.done) {{ if (worker) worker.terminate(); resolve({{ rows: all, version: m.version, unchanged: m.unchanged }}); }}
+                }};
+                try {{
+                    if (workerUrl === undefined) workerUrl = URL.createObjectURL(new Blob([`const csvParser = ${{csvParser}}; const sheetTask = ${{sheetTask}}; self.onmessage = (e) => sheetTask(e.data, (m) => self.postMessage(m));`], {{ type: 'text/javascript' }}));
+                    worker = new Worker(workerUrl);
+                    worker.onmessage = (e) => handle(e.data);
+                    worker.onerror = (e) => {{ e.preventDefault(); worker.terminate(); worker = null; if (started) reject(new Error('Sheet worker failed')); else sheetTask(job, handle); }};
+                    worker.postMessage(job);
+                }} catch(e) {{ worker = null; sheetTask(job, handle); }}
+            }});
+        }}
+        async function load(url, prev, onBatch) {{
+            const out = await stream(url, prev && prev.version, onBatch);
+            const rows = out.unchanged ? prev.rows : out.rows;
+            write(url, {{ rows, version: out.version, time: Date.now() }});
+            return rows;
+        }}
+        function rows(url, onBatch) {{
+            // onBatch(rows) sees every row exactly once: streamed batches on a cold load, one batch when cached
+            if (!pending[url]) {{
+                const hit = read(url);
+                if (hit && Date.now() - hit.time > TTL) load(url, hit).catch(() => {{}});
+                if (!hit) return pending[url] = load(url, null, onBatch);
+                pending[url] = Promise.resolve(hit.rows);
+            }}
+            return onBatch ? pending[url].then((all) => {{ onBatch(all); return all; }}) : pending[url];
+        }}
+        return {{ rows }};
+    }})();
+    """
+
+def gen_grid_js():
+    return """
+    function gridWindow(box, renderCard, pageSize = 24) {
+        // Cards are built a page at a time into one <template> and inserted at once; further pages wait until a
+        // sentinel under the grid comes within a screen of the viewport, so big catalogs never hit the DOM in one go
+        const queue = [], tpl = document.createElement('template');
+        let sentinel = null, observer = null;
+        function renderPage() {
+            tpl.innerHTML = queue.splice(0, pageSize).map(renderCard).join('');
+            box.appendChild(tpl.content);
+            if (typeof TitanMotion !== 'undefined') TitanMotion.reveal(box);
+            // Re-observing reports the sentinel's current intersection again, so a tall screen keeps filling
+            if (observer) { observer.unobserve(sentinel); if (queue.length) observer.observe(sentinel); }
+        }
+        function push(rows) {
+            for (const row of rows) queue.push(row);
+            if (!('IntersectionObserver' in window)) { while (queue.length) renderPage(); return; }
+            if (!observer) {
+                sentinel = document.createElement('div'); sentinel.style.height = '1px'; box.after(sentinel);
+                observer = new IntersectionObserver((entries) => { if (entries[0].isIntersecting && queue.length) renderPage(); }, { rootMargin: '100% 0px' });
+            }
+            observer.unobserve(sentinel); observer.observe(sentinel);
+        }
+        return { push };
+    }
+    """
+
+def gen_cart_system(c):
+    if not c.wa_num: return ""
+    return """
+    <div id="cart-float" onclick="toggleCart()" style="display:none;"><span>🛒</span> <span id="cart-count">0</span></div>
+    <div id="cart-overlay" onclick="toggleCart()"></div>
+    <div id="cart-modal">
+        <h3>Your Cart</h3><div id="cart-items" style="max-height:300px; overflow-y:auto; margin:1rem 0;"></div>
+        <div style="font-weight:bold; font-size:1.2rem; margin-bottom:1rem; text-align:right;">Total: <span id="cart-total">0.00</span></div>
+        <button onclick="checkoutWhatsApp()" class="btn btn-accent" style="width:100%">Checkout via WhatsApp</button>
+    </div>
+    """
+
+def gen_cart_js(c):
+    if not c.wa_num: return ""
+    clean_wa = c.wa_num.replace("+", "").replace(" ", "").replace("-", "")
+    return f"""
+    // Amounts are numbers from the build (data-cart-amount); carts saved before that get parsed once here
+    let cart = (JSON.parse(localStorage.getItem('titanCart')) || []).map((i) => typeof i.amount === 'number' ? i : {{ ...i, amount: parseFloat(String(i.price).replace(/[^0-9.]/g, '')) || 0 }});
+    const waNumber = "{clean_wa}";
+    const payLinks = "UPI: {c.upi_id} | PayPal: {c.paypal_link}";
+    function renderCart() {{
+        const box = document.getElementById('cart-items'); if(!box) return;
+        // One parse for the whole list; names and prices come from sheet-driven data-* attributes
+        box.innerHTML = cart.map((item, i) => `<div class="cart-item"><span>${{escapeHTML(item.name)}}</span><span>${{escapeHTML(item.price)}} <span onclick="remItem(${{i}})" style="color:red;cursor:pointer;">x</span></span></div>`).join('');
+        const total = cart.reduce((sum, item) => sum + item.amount, 0);
+        document.getElementById('cart-count').innerText = cart.length; document.getElementById('cart-total').innerText = total.toFixed(2);
+        document.getElementById('cart-float').style.display = cart.length > 0 ? 'flex' : 'none';
+        localStorage.setItem('titanCart', JSON.stringify(cart));
+    }}
+    function addToCart(name, price, amount) {{ cart.push({{name, price, amount: Number(amount) || 0}}); renderCart(); alert(name + " added!"); }}
+    function remItem(i) {{ cart.splice(i,1); renderCart(); }}
+    function toggleCart() {{ const m = document.getElementById('cart-modal'); m.style.display = m.style.display === 'block' ? 'none' : 'block'; document.getElementById('cart-overlay').style.display = m.style.display; }}
+    function checkoutWhatsApp() {{
+        let msg = "New Order:%0A"; let total = 0;
+        cart.forEach(i => {{ msg += `- ${{i.name}} (${{i.price}})%0A`; total += i.amount; }});
+        msg += `%0ATotal: ${{total.toFixed(2)}}%0A%0A${{payLinks}}`;
+        window.open(`https://wa.me/${{waNumber}}?text=${{msg}}`, '_blank');
+        cart = []; renderCart(); toggleCart();
+    }}
+    document.addEventListener('click', (e) => {{ const b = e.target.closest('[data-cart-name]'); if (b) addToCart(b.dataset.cartName, b.dataset.cartPrice, b.dataset.cartAmount); }});
+    window.addEventListener('load', renderCart);
+    """
+
+@memo_section("popup_enabled", "popup_title", "popup_text", "wa_num", "popup_cta", "popup_delay")
+def gen_popup(c):
+    if not c.popup_enabled: return ""
+    return f"""
+    <div id="lead-popup" data-delay="{c.popup_delay * 1000}">
+        <div class="close-popup" onclick="document.getElementById('lead-popup').style.display='none'">&times;</div>
+        <h3>{c.popup_title}</h3><p>{c.popup_text}</p>
+        <a href="https://wa.me/{c.wa_num}?text=I want the offer" class="btn btn-accent" target="_blank">{c.popup_cta}</a>
+    </div>
+    """
+
+def gen_inventory_js(c, is_demo=False):
+    demo_flag = "const isDemo = true;" if is_demo else "const isDemo = false;"
+    return f"""
+    {gen_csv_parser()}
+    <script>
+    {demo_flag}
+    async function loadInv() {{
+        try {{
+            const box = document.getElementById('inv-grid'); if(!box) return; box.innerHTML = '';
+            const grid = gridWindow(box, (c) => {{
+                let img = c[3] && c[3].length > 5 ? c[3] : '{c.custom_feat}';
+                let stripe = (c.length > 4 && c[4].includes('http')) ? c[4] : '';
+                let btn = stripe ? `<a href="${{stripe}}" class="btn btn-primary" style="width:100%;">Buy Now</a>` : `<button data-cart-name="${{escapeHTML(c[0])}}" data-cart-price="${{escapeHTML(c[1])}}" data-cart-amount="${{parsePrice(c[1])}}" class="btn" style="width:100%;">Add to Cart</button>`;
+                return `<div class="card reveal"><img src="${{img}}" class="prod-img" loading="lazy"><div><h3>${{c[0]}}</h3><p style="font-weight:bold; color:var(--s);">${{c[1]}}</p><p style="font-size:0.9rem; opacity:0.8;">${{c[2]}}</p>${{btn}}</div></div>`;
+            }});
+            await TitanData.rows('{c.sheet_url}', (rows) => grid.push(rows.filter((c) => c.length > 1)));
+        }} catch(e) {{ console.log(e); }}
+    }}
+    if(document.getElementById('inv-grid')) window.addEventListener('load', loadInv);
+    </script>
+    """
+
+def parse_price(text):
+    # Same rule as the client's parsePrice(): digits and dots only, then the leading number ("$1,466/mo" -> 1466.0)
+    m = re.match(r'\d*\.?\d*', re.sub(r'[^0-9.]', '', str(text)))
+    try: return float(m.group())
+    except ValueError: return 0.0
+
+def get_store_items(c, rows):
+    items, seen = [], set()
+    for row in rows:
+        if len(row) < 2: continue
+        row = row + [""] * (5 - len(row))
+        slug = base_slug = slugify(row[0]); n = 2
+        while slug in seen: slug = f"{base_slug}-{n}"; n += 1
+        seen.add(slug)
+        items.append({
+            "slug": slug, "name": row[0], "price": row[1], "amount": parse_price(row[1]), "desc": row[2],
+            "img": row[3] if len(row[3]) > 5 else c.custom_feat,
+            "stripe": row[4] if 'http' in row[4] else ""
+        })
+    return items
+
+CARD_SIZES = "(max-width: 768px) 100vw, 400px"
+# The .prod-img slot: up to 400px wide, 250px tall
+CARD_RATIO = "8/5"
+
+def gen_cart_button(item, cls="btn", style="width:100%;"):
+    style_attr = f' style="{style}"' if style else ''
+    if item['stripe']: return f'<a href="{item["stripe"]}" class="btn btn-primary"{style_attr}>Buy Now</a>'
+    return f'<button data-cart-name="{html.escape(item["name"])}" data-cart-price="{html.escape(item["price"])}" data-cart-amount="{item["amount"]}" class="{cls}"{style_attr}>Add to Cart</button>'
+
+def gen_product_card(c, item):
+    link = f"product/{item['slug']}.html"
+    return f"""<div class="card reveal"><a href="{link}">{gen_picture(c, item['img'], alt=item['name'], cls="prod-img", sizes=CARD_SIZES, ratio=CARD_RATIO)}</a><div><h3><a href="{link}">{item['name']}</a></h3><p style="font-weight:bold; color:var(--s);">{item['price']}</p><p style="font-size:0.9rem; opacity:0.8;">{item['desc']}</p>{gen_cart_button(item)}</div></div>"""
+
+@memo_section("show_inventory", "live_store", "sheet_url", "custom_feat", "images")
+def gen_inventory(c, store_items=None):
+    if not c.show_inventory: return ""
+    grid = "".join(gen_product_card(c, item) for item in store_items) if store_items else "<div>Loading...</div>"
+    loader = gen_inventory_js(c, is_demo=False) if (not store_items or c.live_store) else ""
+    return f"""<section id="inventory" style="background:rgba(0,0,0,0.02)"><div class="container"><div class="section-head reveal"><h2 id="store-title">Store</h2></div><div id="inv-grid" class="grid-3">{grid}</div></div></section>{loader}"""
+
+@memo_section("about_h", "about_short", "about_img", "images")
+def gen_about_section(c):
+    return f"""<section id="about"><div class="container"><div class="about-grid"><div class="reveal"><h2 id="about-title">{c.about_h}</h2><div>{format_text(c.about_short)}</div><a href="about.html" class="btn btn-primary" id="about-btn">Read More</a></div>{gen_picture(c, c.about_img, alt=c.about_h, cls="reveal", style="width:100%; border-radius:var(--radius);", sizes="(max-width: 768px) 100vw, 50vw")}</div></div></section>"""
+
+@memo_section("faq_data")
+def gen_faq_section(c):
+    items = "".join([f"<details class='reveal'><summary>{l.split('?')[0]}?</summary><p>{l.split('?')[1]}</p></details>" for l in c.faq_data.split('\n') if "?" in l])
+    return f"""<section id="faq"><div class="container" style="max-width:800px;"><div class="section-head reveal"><h2 id="faq-title">Frequently Asked Questions</h2></div>{items}</div></section>"""
+
+@memo_section("fb_link", "ig_link", "x_link", "li_link", "yt_link", "biz_name", "biz_addr")
+def gen_footer(c):
+    links = (("facebook", c.fb_link), ("instagram", c.ig_link), ("x", c.x_link), ("linkedin", c.li_link), ("youtube", c.yt_link))
+    icons = "".join(f"""<a href="{url}" target="_blank" style="display:inline-block; margin-right:15px;">{svg_icon(name, ' class="social-icon"')}</a>""" for name, url in links if url)
+
+    return f"""
+    <footer><div class="container">
+        <div class="footer-grid">
+            <div>
+                <h3 style="color:white; margin-bottom:1.5rem;">{c.biz_name}</h3>
+                <p style="color:rgba(255,255,255,0.7); opacity:1;">{c.biz_addr}</p>
+                <div style="margin-top:1.5rem;">{icons}</div>
+            </div>
+            <div>
+                <h4 style="color:white; text-transform:uppercase;">Links</h4>
+                <a href="index.html" style="color:white!important; display:block; margin-bottom:0.5rem;" id="footer-home">Home</a>
+                <a href="blog.html" style="color:white!important; display:block; margin-bottom:0.5rem;" id="footer-blog">Blog</a>
+                <a href="booking.html" style="color:white!important; display:block; margin-bottom:0.5rem;" id="footer-book">Book Now</a>
+            </div>
+            <div>
+                <h4 style="color:white; text-transform:uppercase;">Legal</h4>
+                <a href="privacy.html" style="color:white!important; display:block; margin-bottom:0.5rem;">Privacy</a>
+                <a href="terms.html" style="color:white!important; display:block; margin-bottom:0.5rem;">Terms</a>
+            </div>
+        </div>
+        <div style="border-top:1px solid rgba(255,255,255,0.1); margin-top:3rem; padding-top:2rem; text-align:center; color:rgba(255,255,255,0.5);">
+            &copy; 2026 {c.biz_name}. Powered by Titan Engine.
+        </div>
+    </div></footer>
+    """
+
+@memo_section("wa_num")
+def gen_wa_widget(c):
+    if not c.wa_num: return ""
+    clean_wa = c.wa_num.replace("+", "").replace(" ", "").replace("-", "")
+    return f"""<a href="https://wa.me/{clean_wa}" class="wa-float" target="_blank" style="position:fixed; bottom:30px; right:30px; background:#25d366; color:white; width:60px; height:60px; border-radius:50%; display:flex; align-items:center; justify-content:center; box-shadow:0 10px 30px rgba(37,211,102,0.4); z-index:9999;">{svg_icon("whatsapp", ' style="width:32px;height:32px" fill="currentColor"')}</a>"""
+
+def gen_runtime_js():
+    # Page motion: observer-driven reveals, a carousel that only runs while visible, and the popup on an idle callback
+    return """
+    const TitanMotion = (() => {
+        const reduced = !!(window.matchMedia && matchMedia('(prefers-reduced-motion: reduce)').matches);
+        const observe = 'IntersectionObserver' in window;
+        let revealer = null;
+        function reveal(root) {
+            const els = (root || document).querySelectorAll('.reveal:not(.active)');
+            if (reduced || !observe) { els.forEach((el) => el.classList.add('active')); return; }
+            revealer = revealer || new IntersectionObserver((entries) => {
+                for (const e of entries) if (e.isIntersecting) { e.target.classList.add('active'); revealer.unobserve(e.target); }
+            }, { rootMargin: '0px 0px -100px 0px' });
+            els.forEach((el) => revealer.observe(el));
+        }
+        function carousel(root) {
+            const slides = root.querySelectorAll('.carousel-slide'), interval = +root.dataset.carousel || 4000;
+            if (slides.length < 2 || reduced) return;
+            let current = 0, timer = null, visible = true;
+            const tick = () => { slides[current].classList.remove('active'); current = (current + 1) % slides.length; slides[current].classList.add('active'); };
+            const sync = () => {
+                const run = visible && !document.hidden;
+                if (run && !timer) timer = setInterval(tick, interval);
+                if (!run && timer) { clearInterval(timer); timer = null; }
+            };
+            if (observe) new IntersectionObserver((entries) => { visible = entries[0].isIntersecting; sync(); }).observe(root);
+            document.addEventListener('visibilitychange', sync);
+            sync();
+        }
+        function idle(fn, delay) { setTimeout(() => (window.requestIdleCallback || ((f) => setTimeout(f, 1)))(fn, { timeout: 2000 }), delay); }
+        function popup() {
+            const el = document.getElementById('lead-popup');
+            if (!el || localStorage.getItem('popupShown')) return;
+            idle(() => { el.style.display = 'block'; localStorage.setItem('popupShown', 'true'); }, +el.dataset.delay || 0);
+        }
+        function start() { reveal(); document.querySelectorAll('[data-carousel]').forEach(carousel); popup(); }
+        if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', start); else start();
+        return { reveal, idle };
+    })();
+    """
+
+def gen_search_js(c):
+    # Loads search/index.json on first focus; prefix lookups are a binary search over the sorted terms
+    if not c.show_search: return ""
+    # Result URLs are site-root relative; a language copy (<html lang> other than the default) links into its own folder
+    return """
+    const TitanSearch = (() => {
+        let index = null; const shards = {};
+        const fold = (s) => String(s).normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+        const tokenize = (s) => fold(s).match(/[a-z0-9]+/g) || [];
+        const load = () => index || (index = fetch('search/index.json').then((r) => r.json()));
+        async function terms(ch) {
+            const idx = await load();
+            if (!idx.shards) return idx;
+            if (!idx.shards.includes(ch)) return { k: [], d: [] };
+            return shards[ch] || (shards[ch] = fetch('search/terms-' + ch + '.json').then((r) => r.json()));
+        }
+        function prefixIds(t, q) {
+            let lo = 0, hi = t.k.length;
+            while (lo < hi) { const mid = (lo + hi) >> 1; if (t.k[mid] < q) lo = mid + 1; else hi = mid; }
+            const ids = new Set();
+            for (let i = lo; i < t.k.length && t.k[i].startsWith(q); i++) for (const id of t.d[i]) ids.add(id);
+            return ids;
+        }
+        async function query(text, limit = 8) {
+            const tokens = tokenize(text), idx = await load();
+            let hits = null;
+            for (const q of tokens) {
+                const ids = prefixIds(await terms(q[0]), q);
+                hits = hits ? new Set([...hits].filter((id) => ids.has(id))) : ids;
+                if (!hits.size) return [];
+            }
+            // Every word must match as a prefix; title matches rank first, then build order
+            const title = (id) => tokens.filter((q) => fold(idx.docs[id].t).includes(q)).length;
+            return [...(hits || [])].sort((a, b) => title(b) - title(a) || a - b).slice(0, limit).map((id) => idx.docs[id]);
+        }
+        return { load, query };
+    })();
+    (function() {
+        const input = document.getElementById('site-search'), box = document.getElementById('search-results');
+        if (!input) return;
+        const lang = document.documentElement.lang, prefix = lang && lang !== '""" + DEFAULT_LANG + """' ? lang + '/' : '';
+        let seq = 0;
+        input.addEventListener('focus', () => TitanSearch.load().catch(() => {}), { once: true });
+        input.addEventListener('input', async () => {
+            const n = ++seq, results = await TitanSearch.query(input.value).catch(() => []);
+            if (n !== seq) return;
+            box.innerHTML = results.map((d) => `<a href="${escapeHTML(prefix + d.u)}"><strong>${escapeHTML(d.t)}</strong><small>${escapeHTML(d.k)} · ${escapeHTML(d.s)}</small></a>`).join('');
+            box.style.display = results.length ? 'block' : 'none';
+        });
+        input.addEventListener('keydown', (e) => { if (e.key === 'Escape') { input.value = ''; box.style.display = 'none'; } });
+        document.addEventListener('click', (e) => { if (!e.target.closest('.nav-search')) box.style.display = 'none'; });
+    })();
+    """
+
+def gen_facade_js():
+    # Template content is inert: scripts are recreated so the embed's own loader runs once swapped in
+    return """
+    const TitanFacades = (() => {
+        function load(el) {
+            if (!el.hasAttribute('data-facade')) return;
+            const frag = el.querySelector('template').content.cloneNode(true);
+            frag.querySelectorAll('script').forEach((old) => {
+                const s = document.createElement('script');
+                for (const a of old.attributes) s.setAttribute(a.name, a.value);
+                s.textContent = old.textContent;
+                old.replaceWith(s);
+            });
+            el.removeAttribute('data-facade');
+            el.replaceChildren(frag);
+            el.classList.add('facade-loaded');
+        }
+        let seen = null;
+        function scan(root) {
+            seen = seen || ('IntersectionObserver' in window ? new IntersectionObserver((entries) => {
+                for (const e of entries) if (e.isIntersecting) { seen.unobserve(e.target); load(e.target); }
+            }, { rootMargin: '200px' }) : null);
+            (root || document).querySelectorAll('[data-facade]').forEach((el) => {
+                el.addEventListener('click', (e) => { if (!e.target.closest('a')) load(el); });
+                const mode = el.dataset.facade;
+                if (mode === 'visible') { if (seen) seen.observe(el); else load(el); }
+                if (mode === 'idle') {
+                    // Decorative video: skipped for reduced motion and Save-Data
+                    if ((navigator.connection && navigator.connection.saveData) || (window.matchMedia && matchMedia('(prefers-reduced-motion: reduce)').matches)) return;
+                    const later = () => TitanMotion.idle(() => load(el), 0);
+                    if (document.readyState === 'complete') later(); else window.addEventListener('load', later);
+                }
+            });
+        }
+        if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', () => scan()); else scan();
+        return { load, scan };
+    })();
+    """
+
+def gen_sw_register_js():
+    return "if ('serviceWorker' in navigator) { navigator.serviceWorker.register('service-worker.js'); }"
+
+@memo_section("wa_num", "upi_id", "paypal_link", "top_bar_enabled", "show_search")
+def gen_site_js(c, with_parser=True):
+    # The parser bundle carries the shared helpers (escapeHTML, …); without it they still ship on their own
+    parts = [gen_csv_parser_js() if with_parser else gen_util_js(), gen_nav_js(c), gen_cart_js(c), gen_runtime_js(), gen_facade_js(), gen_search_js(c), gen_sw_register_js()]
+    return "\n".join(p for p in parts if p)
+
+FONT_WEIGHTS = (("h_font", (400, 700, 900)), ("b_font", (300, 400, 600)))
+FONT_PRELOADS = (("b_font", "400"), ("h_font", "700"))
+
+def font_families(c):
+    families = {}
+    for key, weights in FONT_WEIGHTS: families.setdefault(getattr(c, key), set()).update(weights)
+    return {family: sorted(weights) for family, weights in families.items()}
+
+def google_fonts_link(families):
+    query = "&".join(f"family={family.replace(' ', '+')}:wght@{';'.join(map(str, weights))}" for family, weights in families)
+    return f'<link href="https://fonts.googleapis.com/css2?{query}&display=swap" rel="stylesheet">'
+
+def gen_font_tags(c):
+    # Self-hosted subset faces (inlined, so relative URLs resolve per page) plus a Google link for any family left remote
+    faces = c.fonts["faces"] if c.fonts else []
+    hosted = {face[0] for face in faces}
+    preload = [path for family, weight, style, path in faces if style == "normal" and (family, weight) in {(getattr(c, k), w) for k, w in FONT_PRELOADS}]
+    tags = "".join(f'<link rel="preload" href="{path}" as="font" type="font/woff2" crossorigin>' for path in preload)
+    if faces: tags += f"<style>{fonts.face_css(faces)}</style>"
+    remote = [(getattr(c, key), weights) for key, weights in FONT_WEIGHTS if getattr(c, key) not in hosted]
+    return tags + (google_fonts_link(remote) if remote else "")
+
+def gen_site_assets(c):
+    # Shared CSS/JS written once per ZIP under content-hashed (immutable) names; hashed after minifying
+    critical, css, js = "", get_theme_css(c), gen_site_js(c)
+    if c.critical_css: critical, css = get_critical_css(c), get_deferred_css(c)
+    if c.minify: critical, css, js = optimize.minify_css(critical), optimize.minify_css(css), optimize.minify_js(js)
+    css_path = f"assets/site.{hashlib.sha256(css.encode()).hexdigest()[:10]}.css"
+    js_path = f"assets/site.{hashlib.sha256(js.encode()).hexdigest()[:10]}.js"
+    headers = "/assets/*\n  Cache-Control: public, max-age=31536000, immutable\n/fonts/*\n  Cache-Control: public, max-age=31536000, immutable\n"
+    return {"css": css_path, "js": js_path, "critical": critical, "files": {css_path: css, js_path: js, "_headers": headers}}
+
+def dedupe_scripts(markup, drop=()):
+    seen = set(drop)
+    def keep_first(m):
+        if m.group(0) in seen: return ""
+        seen.add(m.group(0)); return m.group(0)
+    return re.sub(r'<script>.*?</script>', keep_first, markup, flags=re.S)
+
+def gen_lang_links(c, lang, alternates):
+    # alternates: (language, root-relative path) for every copy of this page, the default language first
+    head = "".join(f'<link rel="alternate" hreflang="{code}" href="{c.prod_url}/{path.removesuffix("index.html")}">' for code, path in alternates)
+    head += f'<link rel="alternate" hreflang="x-default" href="{c.prod_url}/{alternates[0][1].removesuffix("index.html")}">'
+    # "./" keeps the switch out of localize_links(); every page's base is the site root
+    nav = "".join(f'<a href="./{path}" hreflang="{code}" lang="{code}" title="Switch Language">🌐 {code.upper()}</a>' for code, path in alternates if code != lang)
+    return head, nav
+
+LANG_SLOT = "<!--titan:lang-->"
+
+def gen_page_shell(c, assets=None):
+    # Everything around the content that every page shares; build_site renders it once and splices it into each page
+    pwa_tags = f'<link rel="manifest" href="manifest.json"><meta name="theme-color" content="{c.p_color}"><link rel="apple-touch-icon" href="{c.pwa_icon}">'
+    if assets:
+        if assets.get("critical"):
+            # Inline the above-the-fold CSS and fetch the rest without blocking first paint
+            head_assets = f"""<style>{assets["critical"]}</style><link rel="preload" href="{assets["css"]}" as="style" onload="this.onload=null;this.rel='stylesheet'"><noscript><link rel="stylesheet" href="{assets["css"]}"></noscript>"""
+        else:
+            head_assets = f'<link rel="stylesheet" href="{assets["css"]}">'
+        head_assets += f'<script src="{assets["js"]}" defer></script>'
+    else:
+        head_assets = f"<style>{get_theme_css(c)}</style>"
+    nav_start, nav_end = gen_nav(c, LANG_SLOT).split(LANG_SLOT)
+    return {"pwa": pwa_tags, "head": f"{gen_schema(c)}{gen_font_tags(c)}{head_assets}", "nav": (nav_start, nav_end),
+            "tail": f"{gen_footer(c)}{gen_wa_widget(c)}{gen_cart_system(c)}", "popup": gen_popup(c), "parser": gen_csv_parser(), "assets": bool(assets)}
+
+def build_page(c, title, content, extra_js="", base="", assets=None, lang=DEFAULT_LANG, alternates=None, shell=None):
+    shell = shell or gen_page_shell(c, assets)
+    base_tag = f'<base href="{base}">' if base else ''
+    lang_head, lang_nav = gen_lang_links(c, lang, alternates) if alternates else ("", "")
+    if shell["assets"]:
+        body = dedupe_scripts(content, drop=[shell["parser"]])
+        site_js = ""
+    else:
+        body = dedupe_scripts(content)
+        site_js = f"<script>{gen_site_js(c, with_parser=c.show_search and shell['parser'] not in body)}</script>"
+    return f"""<!DOCTYPE html><html lang="{lang}"><head><meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">{base_tag}<title>{title} | {c.biz_name}</title>{shell["pwa"]}{lang_head}{shell["head"]}</head><body>{shell["nav"][0]}{lang_nav}{shell["nav"][1]}{body}{shell["tail"]}{site_js}{shell["popup"]}{extra_js}</body></html>"""
+
+@memo_section("booking_title", "booking_desc", "booking_embed")
+def gen_booking_content(c):
+    return f"""
+    <section class="hero" style="min-height:30vh; background:var(--p);">
+        <div class="container hero-content"><h1>{c.booking_title}</h1><p>{c.booking_desc}</p></div>
+    </section>
+    <section>
+        <div class="container" style="text-align:center;">
+            <div style="background:white; border-radius:12px; overflow:hidden; box-shadow:0 10px 40px rgba(0,0,0,0.1); width:100%;">
+                {gen_facade(c.booking_embed, "visible", "📅 Load booking calendar", style=f"min-height:{embed_height(c.booking_embed, 630)}px") if c.booking_embed.strip() else ""}
+            </div>
+        </div>
+    </section>
+    """
+
+def get_blog_posts(rows):
+    posts, seen = [], set()
+    for r in rows:
+        if len(r) < 5: continue
+        r = r + [""] * (7 - len(r))
+        slug = base_slug = slugify(r[0]); n = 2
+        while slug in seen: slug = f"{base_slug}-{n}"; n += 1
+        seen.add(slug)
+        posts.append({"id": r[0], "slug": slug, "title": r[1], "date": r[2], "category": r[3], "summary": r[4], "img": r[5], "body": r[6]})
+    return posts
+
+def gen_blog_card(c, post):
+    link = f"blog/{post['slug']}.html"
+    return f"""
+    <div class="card reveal" style="display:flex; flex-direction:column; justify-content:space-between;">
+        <div>
+            {gen_picture(c, post['img'], alt=post['title'], cls="prod-img", sizes=CARD_SIZES, ratio=CARD_RATIO)}
+            <span class="blog-badge" style="margin-top:1rem;">{post['category']}</span>
+            <h3 style="margin-top:0.5rem;"><a href="{link}">{post['title']}</a></h3>
+            <p>{post['summary']}</p>
+        </div>
+        <a href="{link}" class="btn btn-primary" style="margin-top:1rem; width:100%;">Read More</a>
+    </div>"""
+
+@memo_section("hero_img_1", "blog_hero_title", "blog_hero_sub", "live_blog", "blog_sheet_url", "images")
+def gen_blog_index_html(c, posts=None):
+    grid = "".join(gen_blog_card(c, p) for p in posts) if posts else "Loading..."
+    hero = f"""
+    <section class="hero" style="min-height:40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{c.hero_img_1}'); background-size: cover;">
+        <div class="container"><h1>{c.blog_hero_title}</h1><p>{c.blog_hero_sub}</p></div>
+    </section>
+    <section><div class="container"><div id="blog-grid" class="grid-3">{grid}</div></div></section>
+    """
+    if posts and not c.live_blog: return hero
+    return hero + gen_blog_loader_js(c)
+
+def gen_blog_loader_js(c):
+    return f"""
+    {gen_csv_parser()}
+    <script>
+    async function loadBlog() {{
+        try {{
+            const box = document.getElementById('blog-grid');
+            box.innerHTML = '';
+            const grid = gridWindow(box, (r) => `
+                    <div class="card reveal" style="display:flex; flex-direction:column; justify-content:space-between;">
+                        <div>
+                            <img src="${{r[5]}}" class="prod-img" loading="lazy">
+                            <span class="blog-badge" style="margin-top:1rem;">${{r[3]}}</span>
+                            <h3 style="margin-top:0.5rem;"><a href="post.html?id=${{r[0]}}">${{r[1]}}</a></h3>
+                            <p>${{r[4]}}</p>
+                        </div>
+                        <a href="post.html?id=${{r[0]}}" class="btn btn-primary" style="margin-top:1rem; width:100%;">Read More</a>
+                    </div>`);
+            await TitanData.rows('{c.blog_sheet_url}', (rows) => grid.push(rows.filter((r) => r.length > 4)));
+        }} catch(e) {{}}
+    }}
+    window.addEventListener('DOMContentLoaded', loadBlog);
+    </script>
+    """
+
+@memo_section("sheet_url", "custom_feat", "live_store")
+def gen_product_page_content(c, is_demo=False, records=False):
+    demo_flag = "const isDemo = true;" if is_demo else "const isDemo = false;"
+    return f"""
+    <section style="padding-top:150px;"><div class="container"><div id="product-detail">Loading...</div></div></section>
+    {gen_csv_parser()}
+    <script>
+    {demo_flag}
+    const productRecords = {str(records and not c.live_store).lower()};
+    function shareWA(url, title) {{ window.open('https://wa.me/?text=' + encodeURIComponent(title + ' ' + url), '_blank'); }}
+    async function findProduct(name) {{
+        // Pre-rendered stores ship data/products/<slug>.json: one tiny fetch instead of scanning the whole sheet
+        if(productRecords && !isDemo && name) {{
+            const item = await fetch('data/products/' + slugify(name) + '.json').then((r) => r.ok ? r.json() : null).catch(() => null);
+            if(item && item.name === name) return item;
+        }}
+        let found = null;
+        await TitanData.rows('{c.sheet_url}', (rows) => {{ for(const r of rows) {{
+            if(found) return;
+            if(isDemo) name = r[0];
+            if(r[0] === name) found = {{ name: r[0], price: r[1], amount: parsePrice(r[1]), desc: r[2], img: r[3] || '{c.custom_feat}', stripe: (r.length > 4 && r[4].includes('http')) ? r[4] : '' }};
+        }} }});
+        return found;
+    }}
+    async function loadProduct() {{
+        const params = new URLSearchParams(window.location.search);
+        let targetName = params.get('item');
+        if(isDemo && !targetName) targetName = "Demo Item";
+        try {{
+            const item = await findProduct(targetName);
+            if(!item) return;
+            let btn = item.stripe ? `<a href="${{item.stripe}}" class="btn btn-primary">Buy Now</a>` : `<button data-cart-name="${{escapeHTML(item.name)}}" data-cart-price="${{escapeHTML(item.price)}}" data-cart-amount="${{item.amount}}" class="btn btn-primary">Add to Cart</button>`;
+            const u = encodeURIComponent(window.location.href);
+            const t = encodeURIComponent(item.name);
+            
+            document.getElementById('product-detail').innerHTML = `
+                <div class="detail-view">
+                    <img src="${{item.img}}" style="width:100%; border-radius:12px;">
+                    <div>
+                        <h1 style="font-size:3rem; line-height:1.1;">${{item.name}}</h1>
+                        <p style="font-size:1.5rem; color:var(--s); font-weight:bold; margin-bottom:1.5rem;">${{item.price}}</p>
+                        <p>${{item.desc}}</p>
+                        ${{btn}}
+                        
+                        <div style="margin-top:2rem; border-top:1px solid #eee; padding-top:1rem;">
+                            <p style="font-size:0.9rem; font-weight:bold;">Share Product:</p>
+                            <div class="share-row">
+                                {gen_share_links('${u}', '${t}')}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+        }} catch(e) {{}}
+    }}
+    window.addEventListener('DOMContentLoaded', loadProduct);
+</script>
+"""
+
+def gen_share_links(u, t):
+    # u and t arrive URL-encoded: quoted in Python for static pages, ${u}/${t} inside the client-side templates
+    return f"""<a href="https://wa.me/?text={t}%20{u}" target="_blank" class="share-btn bg-wa">{svg_icon("whatsapp")}</a>
+        <a href="https://www.facebook.com/sharer/sharer.php?u={u}" target="_blank" class="share-btn bg-fb">{svg_icon("facebook")}</a>
+        <a href="https://twitter.com/intent/tweet?url={u}&text={t}" target="_blank" class="share-btn bg-x">{svg_icon("x")}</a>
+        <a href="https://www.linkedin.com/sharing/share-offsite/?url={u}" target="_blank" class="share-btn bg-li">{svg_icon("linkedin")}</a>
+        <a href="https://www.reddit.com/submit?url={u}&title={t}" target="_blank" class="share-btn bg-rd">{svg_icon("reddit")}</a>
+        <button onclick="navigator.clipboard.writeText(window.location.href);alert('Link Copied!')" class="share-btn bg-link" title="Copy Link">{svg_icon("link")}</button>"""
+
+def gen_share_row(page_url, title):
+    u = urllib.parse.quote(page_url, safe='')
+    t = urllib.parse.quote(title, safe='')
+    return f"""<div class="share-row">
+        {gen_share_links(u, t)}
+    </div>"""
+
+def gen_product_record(item):
+    return {k: item[k] for k in ("slug", "name", "price", "amount", "desc", "img", "stripe")}
+
+def gen_product_static_content(c, item):
+    page_url = f"{c.prod_url.rstrip('/')}/product/{item['slug']}.html"
+    return f"""
+    <section style="padding-top:150px;"><div class="container"><div id="product-detail">
+        <div class="detail-view">
+            {gen_picture(c, item['img'], alt=item['name'], style="width:100%; height:auto; border-radius:12px;", sizes="(max-width: 768px) 100vw, 50vw", eager=True)}
+            <div>
+                <h1 style="font-size:3rem; line-height:1.1;">{item['name']}</h1>
+                <p style="font-size:1.5rem; color:var(--s); font-weight:bold; margin-bottom:1.5rem;">{item['price']}</p>
+                <p>{item['desc']}</p>
+                {gen_cart_button(item, cls="btn btn-primary", style="")}
+                <div style="margin-top:2rem; border-top:1px solid #eee; padding-top:1rem;">
+                    <p style="font-size:0.9rem; font-weight:bold;">Share Product:</p>
+                    {gen_share_row(page_url, item['name'])}
+                </div>
+            </div>
+        </div>
+    </div></div></section>
+    """
+
+def gen_blog_static_post(c, post):
+    page_url = f"{c.prod_url.rstrip('/')}/blog/{post['slug']}.html"
+    return f"""
+    <div id="post-container" style="padding-top:70px;">
+        <div style="background:var(--p); padding:clamp(3rem, 8vw, 6rem) 1rem; color:white; text-align:center;">
+            <div class="container">
+                <span class="blog-badge">{post['category']}</span>
+                <h1 style="font-size:clamp(1.8rem, 5vw, 3.5rem); margin-top:1rem;">{post['title']}</h1>
+            </div>
+        </div>
+        <div class="container" style="max-width:800px; padding:3rem 1.5rem;">
+            {gen_picture(c, post['img'], alt=post['title'], style="width:100%; height:auto; border-radius:12px; margin-bottom:2rem;", sizes="(max-width: 800px) 100vw, 800px") if post['img'] else ""}
+            <div style="line-height:1.8;">{format_text(post['body'])}</div>
+            <div style="margin-top:3rem; border-top:1px solid #eee; padding-top:1.5rem;">
+                <p style="font-weight:bold;">Share this article:</p>
+                {gen_share_row(page_url, post['title'])}
+            </div>
+            <hr style="margin:2rem 0; border:0; border-top:1px solid #eee;">
+            <a href="blog.html" class="btn btn-primary">&larr; Back to Blog</a>
+        </div>
+    </div>
+    """
+
+def gen_post_redirect(posts):
+    # Old post.html?id= links jump to the static page; unknown ids fall through to the live loader
+    slug_map = json.dumps({p['id']: p['slug'] for p in posts})
+    return f"""<script>(function() {{ const m = {slug_map}; const id = new URLSearchParams(window.location.search).get('id'); if(id && m[id]) window.location.replace('blog/' + m[id] + '.html'); }})();</script>"""
+
+@memo_section("blog_sheet_url")
+def gen_blog_post_html(c, posts=None):
+    return f"""
+    {gen_post_redirect(posts) if posts else ''}
+    <div id="post-container" style="padding-top:70px;">Loading...</div>
+    {gen_csv_parser()}
+    <script>
+    async function loadPost() {{
+        const params = new URLSearchParams(window.location.search);
+        const slug = params.get('id');
+        try {{
+            const container = document.getElementById('post-container');
+            let found = false;
+            await TitanData.rows('{c.blog_sheet_url}', (rows) => {{ for(const r of rows) {{
+                if(found) return;
+                if(r[0] === slug) {{
+                    const contentHtml = parseMarkdown(r[6]);
+                    const u = encodeURIComponent(window.location.href);
+                    const t = encodeURIComponent(r[1]);
+                    
+                    container.innerHTML = `
+                        <div style="background:var(--p); padding:clamp(3rem, 8vw, 6rem) 1rem; color:white; text-align:center;">
+                            <div class="container">
+                                <span class="blog-badge">${{r[3]}}</span>
+                                <h1 style="font-size:clamp(1.8rem, 5vw, 3.5rem); margin-top:1rem;">${{r[1]}}</h1>
+                            </div>
+                        </div>
+                        <div class="container" style="max-width:800px; padding:3rem 1.5rem;">
+                            <img src="${{r[5]}}" style="width:100%; border-radius:12px; margin-bottom:2rem;">
+                            <div style="line-height:1.8;">${{contentHtml}}</div>
+                            
+                            <div style="margin-top:3rem; border-top:1px solid #eee; padding-top:1.5rem;">
+                                <p style="font-weight:bold;">Share this article:</p>
+                                <div class="share-row">
+                                    {gen_share_links('${u}', '${t}')}
+                                </div>
+                            </div>
+                            <hr style="margin:2rem 0; border:0; border-top:1px solid #eee;">
+                            <a href="blog.html" class="btn btn-primary">&larr; Back to Blog</a>
+                        </div>
+                    `;
+                    found = true;
+                }}
+            }} }});
+        }} catch(e) {{}}
+    }}
+    window.addEventListener('DOMContentLoaded', loadPost);
+    </script>
+    """
+
+def gen_inner_header(title):
+    return f"""<section class="hero" style="min-height: 40vh; background:var(--p);"><div class="container"><h1>{title}</h1></div></section>"""
+
+@memo_section("testi_data")
+def gen_testimonials(c):
+    t_cards = "".join([f'<div class="card reveal" style="text-align:center;"><i>"{x.split("|")[1]}"</i><br><b>- {x.split("|")[0]}</b></div>' for x in c.testi_data.split('\n') if "|" in x])
+    return f'<section style="background:#f8fafc"><div class="container"><div class="section-head reveal"><h2>Client Stories</h2></div><div class="grid-3">{t_cards}</div></div></section>'
+
+def gen_cta():
+    return '<section style="background:var(--s); color:white; text-align:center;"><div class="container reveal"><h2>Start Owning Your Future</h2><p style="margin-bottom:2rem;">Stop paying rent.</p><a href="contact.html" class="btn" style="background:white; color:var(--s);">Get Started</a></div></section>'
+
+def gen_search_docs(c, store_items=(), blog_posts=()):
+    docs = [{"title": item["name"], "url": f"product/{item['slug']}.html", "kind": "Product", "text": f"{item['price']} {item['desc']}"} for item in store_items]
+    if c.show_blog: docs += [{"title": post["title"], "url": f"blog/{post['slug']}.html", "kind": "Post", "text": f"{post['summary']} {post['category']} {post['body']}"} for post in blog_posts]
+    if c.show_faq: docs += [{"title": f"{l.split('?')[0]}?", "url": "index.html#faq", "kind": "FAQ", "text": l.split('?', 1)[1].lstrip(' ?')} for l in c.faq_data.split('\n') if "?" in l]
+    if c.show_features: docs += [{"title": p[1].strip(), "url": "index.html#features", "kind": "Feature", "text": p[2]} for p in (l.split('|') for l in c.feat_data.split('\n') if l.strip()) if len(p) >= 3]
+    return docs
+
+def gen_sitemap(c, paths):
+    urls = "".join(f"<url><loc>{c.prod_url}/{p}</loc></url>" for p in paths)
+    return f"""<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>"""
+
+# --- 3. PAGE ASSEMBLY ---
+def gen_home_content(c, store_items=None):
+    home = ""
+    if c.show_hero: home += gen_hero(c)
+    if c.show_stats: home += gen_stats(c)
+    if c.show_features: home += gen_features(c)
+    if c.show_pricing: home += gen_pricing_table(c)
+    if c.show_inventory: home += gen_inventory(c, store_items)
+    if c.show_gallery: home += gen_about_section(c)
+    if c.show_testimonials: home += gen_testimonials(c)
+    if c.show_faq: home += gen_faq_section(c)
+    if c.show_cta: home += gen_cta()
+    return home
+
+def gen_text_page(title, text):
+    return f"{gen_inner_header(title)}<div class='container'>{format_text(text)}</div>"
+
+def gen_map_facade(c):
+    # A static address card stands in for the map until asked for; the Maps link works without loading it
+    if not c.map_iframe.strip(): return ""
+    addr = c.biz_addr.replace("\n", ", ")
+    card = f'<p>{addr}</p><a href="https://www.google.com/maps/search/?api=1&query={urllib.parse.quote(addr)}" target="_blank" rel="noopener">Open in Google Maps</a>'
+    return gen_facade(c.map_iframe, "click", "🗺️ Show map", style=f"min-height:{embed_height(c.map_iframe, 450)}px", content=card)
+
+@memo_section("biz_addr", "biz_phone", "biz_email", "wa_num", "map_iframe")
+def gen_contact_content(c):
+    return f"""{gen_inner_header("Contact Us")}<section><div class="container"><div class="contact-grid"><div><div style="background:var(--card); padding:2rem; border-radius:12px; border:1px solid #eee;"><h3>Get In Touch</h3><p>{c.biz_addr}</p><p><a href="tel:{c.biz_phone}">{c.biz_phone}</a></p><p>{c.biz_email}</p><br><a href="https://wa.me/{c.wa_num}" target="_blank" class="btn btn-accent" style="width:100%;">WhatsApp Us</a></div></div><div class="card"><h3>Send Message</h3><form action="https://formsubmit.co/{c.biz_email}" method="POST"><label>Name</label><input type="text" name="name" required><label>Email</label><input type="email" name="email" required><label>Message</label><textarea name="msg" rows="4" required></textarea><button class="btn btn-primary" type="submit">Send</button></form></div></div><br><div style="border-radius:12px;overflow:hidden;">{gen_map_facade(c)}</div></div></section>"""
+
+LANG_CODE = re.compile(r'^[a-z]{2,3}(-[a-z0-9]{2,8})*$')
+VOID_TAGS = {"img", "input", "br", "hr", "meta", "link", "source"}
+
+def get_translations(rows):
+    # Header "id, es, fr, ...": one {element id: text} map per language column. A sheet without a language
+    # header (the old two-column format behind the 🌐 ES toggle) is read as Spanish.
+    if not rows: return {}
+    langs, body = [h.lower() for h in rows[0][1:]], rows[1:]
+    if not langs or not all(LANG_CODE.match(code) for code in langs): langs, body = ["es"], rows
+    table = {code: {r[0]: r[i] for r in body if len(r) > i and r[0] and r[i]} for i, code in enumerate(langs, 1) if code != DEFAULT_LANG}
+    return {code: strings for code, strings in table.items() if strings}
+
+def translate_html(markup, strings):
+    # Build-time twin of the old toggleLang(): replace the text of each element whose id the sheet names
+    for el_id, text in strings.items():
+        m = re.search(rf'<([a-zA-Z][a-zA-Z0-9]*)\b[^>]*\sid="{re.escape(el_id)}"[^>]*>', markup)
+        if not m or m.group(1).lower() in VOID_TAGS: continue
+        depth = 1
+        for t in re.finditer(rf'<(/?){m.group(1)}\b[^>]*>', markup[m.end():]):
+            depth += -1 if t.group(1) else 1
+            if not depth:
+                markup = markup[:m.end()] + html.escape(text) + markup[m.end() + t.start():]
+                break
+    return markup
+
+def localize_links(markup, lang, page_paths, path):
+    # Links between built pages stay inside the language copy (every copy's <base> is the site root);
+    # a bare "#frag" would resolve against that base too, so it points at the copy itself
+    swap = lambda m: f'href="{lang}/{m.group(1)}{m.group(2) or ""}"' if m.group(1) in page_paths else m.group(0)
+    markup = re.sub(r'href="([A-Za-z0-9_][^"#?:]*\.html)([#?][^"]*)?"', swap, markup)
+    return re.sub(r'href="(#[^"]*)"', lambda m: f'href="{lang}/{path}{m.group(1)}"', markup)
+
+def load_sheet_data(c):
+    # Fetch each sheet once per build; failures fall back to the in-browser loaders
+    store_items, blog_posts, warnings = [], [], []
+    if c.show_inventory and c.prerender_store and c.sheet_url:
+        try: store_items = get_store_items(c, fetch_csv_rows(c.sheet_url))
+        except Exception as e: warnings.append(f"Store pre-render skipped, using live loader: {e}")
+    if c.show_blog and c.prerender_blog and c.blog_sheet_url:
+        try: blog_posts = get_blog_posts(fetch_csv_rows(c.blog_sheet_url))
+        except Exception as e: warnings.append(f"Blog pre-render skipped, using live loader: {e}")
+    return store_items, blog_posts, warnings
+
+def collect_image_urls(c, store_items=(), blog_posts=()):
+    urls = [] if c.hero_video_id else [c.hero_img_1, c.hero_img_2, c.hero_img_3]
+    if c.show_gallery: urls.append(c.about_img)
+    urls += [item['img'] for item in store_items] + [post['img'] for post in blog_posts]
+    return urls
+
+def load_translations(c):
+    if not c.lang_sheet: return {}, []
+    try: return get_translations(fetch_csv_rows(c.lang_sheet, header=True)), []
+    except Exception as e: return {}, [f"Translated pages skipped: {e}"]
+
+def load_images(c, store_items=(), blog_posts=()):
+    if not c.optimize_images: return None, []
+    files, image_map, warnings = images.optimize_images(collect_image_urls(c, store_items, blog_posts))
+    return {"files": files, "map": image_map}, warnings
+
+def load_fonts(c, files):
+    # Subsets to the glyphs of an already-built page set, so it runs between two build_site passes
+    if not c.self_host_fonts: return None, []
+    font_files, faces, warnings = fonts.fetch_fonts(font_families(c), fonts.page_text(files))
+    return ({"files": font_files, "faces": faces} if faces else None), warnings
+
+def build_site(c, store_items=(), blog_posts=(), image_set=None, font_set=None, translations=None):
+    if image_set: c = with_build_data(c, images=image_set["map"])
+    if font_set: c = with_build_data(c, fonts=font_set)
+    site_assets = gen_site_assets(c)
+    files = dict(site_assets["files"])
+    if image_set: files.update(image_set["files"])
+    if font_set: files.update(font_set["files"])
+    langs, pages = sorted(translations or {}), []
+    shell = gen_page_shell(c, site_assets)
+    def page(path, title, content, base=""):
+        pages.append((path, title, content, base))
+        alternates = [(DEFAULT_LANG, path)] + [(code, f"{code}/{path}") for code in langs] if langs else None
+        started = time.perf_counter()
+        files[path] = build_page(c, title, content, base=base, assets=site_assets, alternates=alternates, shell=shell)
+        if profiler.current(): profiler.current().page(path, time.perf_counter() - started)
+    page("index.html", "Home", gen_home_content(c, store_items))
+    page("about.html", "About", gen_text_page("About", c.about_long))
+    page("contact.html", "Contact", gen_contact_content(c))
+    page("privacy.html", "Privacy", gen_text_page("Privacy", c.priv_txt))
+    page("terms.html", "Terms", gen_text_page("Terms", c.term_txt))
+    page("booking.html", "Book Now", gen_booking_content(c))
+    page("product.html", "Product Details", gen_product_page_content(c, is_demo=False, records=bool(store_items)))
+    if c.show_blog:
+        page("blog.html", "Blog", gen_blog_index_html(c, blog_posts))
+        page("post.html", "Article", gen_blog_post_html(c, blog_posts))
+        for post in blog_posts:
+            page(f"blog/{post['slug']}.html", post['title'], gen_blog_static_post(c, post), base="../")
+    for item in store_items:
+        page(f"product/{item['slug']}.html", item['name'], gen_product_static_content(c, item), base="../")
+        files[f"data/products/{item['slug']}.json"] = json.dumps(gen_product_record(item), separators=(",", ":"))
+    # One prerendered copy of every page per language column: switching language is a plain (cached) navigation
+    page_paths = {path for path, *_ in pages}
+    for code in langs:
+        for path, title, content, base in pages:
+            alternates = [(DEFAULT_LANG, path)] + [(other, f"{other}/{path}") for other in langs]
+            markup = build_page(c, title, content, base="../" + base, assets=site_assets, lang=code, alternates=alternates, shell=shell)
+            files[f"{code}/{path}"] = translate_html(localize_links(markup, code, page_paths, path), translations[code])
+
+    files["manifest.json"] = gen_pwa_manifest(c)
+    files["robots.txt"] = f"User-agent: *\nAllow: /\nSitemap: {c.prod_url}/sitemap.xml"
+    site_paths = [""] + [f"product/{item['slug']}.html" for item in store_items]
+    if c.show_blog: site_paths += ["blog.html"] + [f"blog/{post['slug']}.html" for post in blog_posts]
+    site_paths += [f"{code}/{path}" for code in langs for path in site_paths]
+    files["sitemap.xml"] = gen_sitemap(c, site_paths)
+    if c.show_search: files.update(search.build_index(gen_search_docs(c, store_items, blog_posts)))
+    files["service-worker.js"] = gen_sw(c, files)
+    return files
+
+def compile_site(c, offline=False, cache=None):
+    # The single build entry point shared by the UI download and the CLI
+    profile = profiler.current() or (profiler.Profile() if c.build_report else None)
+    # Without a caller's (e.g. the UI session's) section cache, a per-build one still renders each fragment once
+    fragments = _section_cache.get()
+    with profiler.profiling(profile), section_cache(OrderedDict() if fragments is None else fragments):
+        with profiler.stage("sheets"): store_items, blog_posts, warnings = ([], [], []) if offline else load_sheet_data(c)
+        with profiler.stage("images"): image_set, image_warnings = (None, []) if offline else load_images(c, store_items, blog_posts)
+        with profiler.stage("translations"): translations, lang_warnings = ({}, []) if offline else load_translations(c)
+        with profiler.stage("pages"): files = build_site(c, store_items, blog_posts, image_set, translations=translations)
+        with profiler.stage("fonts"):
+            font_set, font_warnings = (None, []) if offline else load_fonts(c, files)
+            if font_set: files = build_site(c, store_items, blog_posts, image_set, font_set, translations)
+        with profiler.stage("post_process"): files, size_report = optimize.post_process(files, minify=c.minify, precompress=c.precompress, cache=cache)
+        with profiler.stage("audit"): audit_rows, violations = audit.audit_site(files, c.budgets, c.prod_url) if c.audit != "Off" else ([], [])
+    if violations and c.audit == "Fail": raise audit.BudgetExceeded(violations)
+    if violations: warnings.append(f"{len(violations)} performance budget(s) exceeded: " + "; ".join(violations[:5]) + (" …" if len(violations) > 5 else ""))
+    if profile: profile.finish(files)
+    # Timings differ run to run, so the report (and with it the ZIP) is only byte-stable when left out
+    if c.build_report: files["build-report.json"] = json.dumps(profile.report(), indent=1)
+    return {"files": files, "warnings": warnings + image_warnings + lang_warnings + font_warnings, "size_report": size_report,
+            "store_items": store_items, "blog_posts": blog_posts, "profile": profile, "audit": audit_rows}
+
+# --- 4. OUTPUT ---
+def write_zip(files, fileobj, cache=None):
+    # Fixed timestamps and permissions: identical configs give byte-identical archives
+    archive.write_zip(files, fileobj, cache=cache)
+
+def zip_bytes(files, cache=None):
+    buf = io.BytesIO()
+    write_zip(files, buf, cache)
+    return buf.getvalue()
+
+def write_dir(files, out_dir):
+    for path, data in files.items():
+        target = os.path.join(out_dir, *path.split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as f: f.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+# --- 5. PROFILING ---
+# Rebinding the module globals routes every internal call through the (inactive by default) profiler
+for _name in [n for n in list(globals()) if n.startswith("gen_")] + ["get_theme_css", "build_page"]:
+    globals()[_name] = profiler.timed(globals()[_name])
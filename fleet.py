@@ -0,0 +1,115 @@
+"""Fleet rebuild: compile many stored projects in a process pool.
+
+Every project in a ProjectStore (or those matching a name pattern) is a
+job; jobs run across cores and each writes <out>/<slug>.zip, identical
+to the UI download. A site whose config version and engine fingerprint
+(a hash of the compiler sources) match its last successful build is
+skipped. Remote sheets, images and fonts are not part of that key, so
+use force=True after content-only changes. One site failing, or
+crashing its worker process, never stops the rest.
+"""
+import os
+import json
+import time
+import fnmatch
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import audit
+import engine
+
+# Everything that shapes the output; a change to any of them invalidates every site
+ENGINE_MODULES = ("engine", "optimize", "fonts", "images", "search", "archive", "audit", "profiler")
+
+
+def engine_fingerprint():
+    h = hashlib.sha256()
+    for name in ENGINE_MODULES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py"), "rb") as f: h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def build_key(values, fingerprint, offline=False):
+    return hashlib.sha256(json.dumps([values, fingerprint, offline], sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _state_path(out_dir, slug):
+    return os.path.join(out_dir, f"{slug}.build.json")
+
+
+def build_one(job):
+    # Runs in a worker process; always returns a result row instead of raising
+    started = time.perf_counter()
+    row = {"project": job["name"], "version": job["version"], "status": "built", "ms": 0.0, "files": 0, "warnings": 0, "error": ""}
+    try:
+        result = engine.compile_site(engine.make_config(job["values"]), offline=job["offline"])
+        zip_path = os.path.join(job["out"], f"{job['slug']}.zip")
+        with open(zip_path + ".tmp", "wb") as f: engine.write_zip(result["files"], f)
+        os.replace(zip_path + ".tmp", zip_path)
+        row.update(files=len(result["files"]), warnings=len(result["warnings"]))
+        with open(_state_path(job["out"], job["slug"]), "w", encoding="utf-8") as f:
+            json.dump({"key": job["key"], "version": job["version"], "warnings": result["warnings"]}, f, indent=1)
+    except audit.BudgetExceeded as e:
+        row.update(status="failed", error=f"{e}: " + "; ".join(e.violations[:3]))
+    except Exception as e:
+        row.update(status="failed", error=f"{type(e).__name__}: {e}")
+    row["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return row
+
+
+def plan(store, out_dir, patterns=(), force=False, offline=False):
+    # (jobs to run, rows for up-to-date sites)
+    fingerprint, jobs, skipped = engine_fingerprint(), [], []
+    for name in store.names():
+        if patterns and not any(fnmatch.fnmatch(name, p) for p in patterns): continue
+        snapshot = store.load(name)
+        slug, key = engine.slugify(name), build_key(snapshot["values"], fingerprint, offline)
+        try:
+            with open(_state_path(out_dir, slug), encoding="utf-8") as f: last = json.load(f)["key"]
+        except (OSError, ValueError, KeyError):
+            last = None
+        if not force and last == key and os.path.exists(os.path.join(out_dir, f"{slug}.zip")):
+            skipped.append({"project": name, "version": snapshot["version"], "status": "skipped", "ms": 0.0, "files": 0, "warnings": 0, "error": ""})
+            continue
+        jobs.append({"name": name, "slug": slug, "version": snapshot["version"], "values": snapshot["values"], "key": key, "out": out_dir, "offline": offline})
+    return jobs, skipped
+
+
+def _failed(job, error):
+    return {"project": job["name"], "version": job["version"], "status": "failed", "ms": 0.0, "files": 0, "warnings": 0, "error": error}
+
+
+def _run(jobs, workers, emit):
+    # Returns the jobs lost to a broken pool
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_one, job): job for job in jobs}
+        for future in as_completed(futures):
+            try: emit(future.result())
+            except BrokenProcessPool: broken.append(futures[future])
+            except Exception as e: emit(_failed(futures[future], f"{type(e).__name__}: {e}"))
+    return broken
+
+
+def run_fleet(store, out_dir, patterns=(), jobs=None, force=False, offline=False, on_result=None):
+    # Every result row (skipped, built and failed) in completion order; on_result sees each as it lands
+    os.makedirs(out_dir, exist_ok=True)
+    todo, rows = plan(store, out_dir, patterns, force, offline)
+    def emit(row):
+        rows.append(row)
+        if on_result: on_result(row)
+    for row in list(rows):
+        if on_result: on_result(row)
+    if not todo: return rows
+    # A worker that dies (segfault, OOM kill) takes the pool's queued jobs with it:
+    # rerun those one process each, so only the site that crashed fails
+    for job in _run(todo, jobs or os.cpu_count(), emit):
+        if _run([job], 1, emit): emit(_failed(job, "worker process died"))
+    return rows
+
+
+def format_row(row):
+    line = f"{row['status']:8} {row['project'][:32]:32} v{row['version']:<4} {row['ms']:>9.1f}ms {row['files']:>6} files"
+    if row["warnings"]: line += f", {row['warnings']} warning(s)"
+    return line + (f"  {row['error']}" if row["error"] else "")
@@ -0,0 +1,73 @@
+"""Optional self-hosted web fonts for the site ZIP.
+
+Asks the Google Fonts CSS API for each family subset to the glyphs the
+built pages use (its text= parameter), downloads the woff2 files and
+rewrites the @font-face rules to local URLs with font-display: swap.
+Families the API does not serve (e.g. Clash Display, Satoshi) keep
+their stylesheet link.
+"""
+import re
+import html
+import hashlib
+import urllib.parse
+
+CSS_API = "https://fonts.googleapis.com/css2"
+# The CSS API picks the font format from the User-Agent; this one is served woff2
+WOFF2_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+# Always kept: text that only arrives at runtime (live sheets, translations, cart totals)
+BASE_GLYPHS = "".join(map(chr, range(0x20, 0x7F))) + "".join(map(chr, range(0xA0, 0x100))) + "–—‘’“”…•€₹"
+FACE = re.compile(r'@font-face\s*\{(.*?)\}', re.S)
+
+
+def page_text(files):
+    chars = set(BASE_GLYPHS)
+    for path, data in files.items():
+        if not path.endswith(".html") or isinstance(data, bytes): continue
+        text = re.sub(r'<(script|style|noscript)\b.*?</\1>', ' ', data, flags=re.S | re.I)
+        chars.update(html.unescape(re.sub(r'<[^>]+>', ' ', text)))
+    return "".join(sorted(ch for ch in chars if ch.isprintable()))
+
+
+def _prop(block, name, default):
+    m = re.search(rf'{name}\s*:\s*([^;]+);', block)
+    return m.group(1).strip() if m else default
+
+
+def _slug(family):
+    return re.sub(r'[^a-z0-9]+', '-', family.lower()).strip('-')
+
+
+def face_css(faces):
+    return "".join(f"@font-face{{font-family:'{family}';font-style:{style};font-weight:{weight};font-display:swap;src:url({path}) format('woff2')}}"
+                   for family, weight, style, path in faces)
+
+
+def fetch_fonts(families, text, session=None, timeout=20, api=CSS_API):
+    # families maps a family name to its weights; returns (files, faces, warnings)
+    files, faces, warnings = {}, [], []
+    if session is None:
+        import requests
+        session = requests.Session()
+    for family, weights in families.items():
+        query = urllib.parse.urlencode({"family": f"{family}:wght@{';'.join(map(str, weights))}", "text": text}, safe=":;@")
+        try:
+            resp = session.get(f"{api}?{query}", headers={"User-Agent": WOFF2_AGENT}, timeout=timeout)
+            resp.raise_for_status()
+            family_files, family_faces = {}, []
+            for block in FACE.findall(resp.text):
+                src = re.search(r"url\(([^)]+)\)\s*format\(['\"]woff2['\"]\)", block)
+                if not src: raise ValueError("no woff2 source in the font CSS")
+                font = session.get(src.group(1).strip("'\""), timeout=timeout)
+                font.raise_for_status()
+                weight, style = _prop(block, "font-weight", "400"), _prop(block, "font-style", "normal")
+                path = f"fonts/{_slug(family)}-{weight}{'-italic' if style == 'italic' else ''}.{hashlib.sha256(font.content).hexdigest()[:10]}.woff2"
+                family_files[path] = font.content
+                family_faces.append((family, weight, style, path))
+            if not family_faces: raise ValueError("no @font-face rules returned")
+        except Exception as e:
+            # Network errors would echo the (long) subset URL; the exception type is enough there
+            warnings.append(f"Font kept on Google Fonts ({family}): {e if isinstance(e, ValueError) else type(e).__name__}")
+            continue
+        files.update(family_files)
+        faces += family_faces
+    return files, faces, warnings
@@ -0,0 +1,81 @@
+"""Optional image stage for the site ZIP.
+
+Downloads every referenced image once and writes resized WebP (and AVIF
+where Pillow supports it) variants plus a JPEG fallback and a tiny LQIP
+placeholder. engine.gen_picture() turns the resulting map into
+<picture>/srcset markup. Needs Pillow; without it the stage is skipped.
+"""
+import io
+import base64
+import hashlib
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+DEFAULT_WIDTHS = (480, 960, 1600)
+LQIP_WIDTH = 24
+
+
+def available():
+    return Image is not None
+
+
+def avif_supported():
+    return available() and ".avif" in Image.registered_extensions()
+
+
+def _encode(img, fmt, **opts):
+    buf = io.BytesIO()
+    img.save(buf, fmt, **opts)
+    return buf.getvalue()
+
+
+def _resize(img, width):
+    if img.width <= width: return img
+    return img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+
+
+def process_image(data, name, widths=DEFAULT_WIDTHS):
+    img = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+    # Never upscale: keep the widths below the original plus the original itself
+    targets = sorted({w for w in widths if w < img.width} | {min(img.width, max(widths))})
+    files, meta = {}, {"webp": [], "avif": [], "width": img.width, "height": img.height}
+    for w in targets:
+        variant = _resize(img, w)
+        path = f"img/{name}-{w}.webp"
+        files[path] = _encode(variant, "WEBP", quality=78, method=6)
+        meta["webp"].append((path, w))
+        if avif_supported():
+            path = f"img/{name}-{w}.avif"
+            files[path] = _encode(variant, "AVIF", quality=55)
+            meta["avif"].append((path, w))
+    fallback = _resize(img, targets[len(targets) // 2]).convert("RGB")
+    meta["fallback"] = f"img/{name}-{fallback.width}.jpg"
+    files[meta["fallback"]] = _encode(fallback, "JPEG", quality=80, optimize=True, progressive=True)
+    lqip = _encode(_resize(img, LQIP_WIDTH).convert("RGB"), "WEBP", quality=30)
+    meta["lqip"] = "data:image/webp;base64," + base64.b64encode(lqip).decode()
+    return files, meta
+
+
+def optimize_images(urls, widths=DEFAULT_WIDTHS, session=None, timeout=20):
+    # session is any requests-compatible client, so a local stand-in server can be used
+    files, image_map, warnings = {}, {}, []
+    if not available():
+        return files, image_map, ["Image optimization skipped: Pillow is not installed."]
+    if session is None:
+        import requests
+        session = requests.Session()
+    for url in dict.fromkeys(u for u in urls if u and u.startswith(("http://", "https://"))):
+        try:
+            resp = session.get(url, timeout=timeout)
+            resp.raise_for_status()
+            out, meta = process_image(resp.content, hashlib.sha1(url.encode()).hexdigest()[:10], widths)
+        except Exception as e:
+            warnings.append(f"Image kept as hotlink ({url}): {e}")
+            continue
+        files.update(out)
+        image_map[url] = meta
+    return files, image_map, warnings
@@ -0,0 +1,108 @@
+"""Output post-processing for the site ZIP: minification and precompressed sidecars.
+
+The minifiers are deliberately conservative (whitespace, comments, inline
+style attributes) so they never need a real parser. Every text asset gets
+.gz and, when the optional brotli package is installed, .br siblings that
+static hosts can serve as-is.
+"""
+import re
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+TEXT_TYPES = (".html", ".css", ".js", ".json", ".xml", ".txt", ".svg")
+PROTECTED = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2>)', re.S | re.I)
+
+
+def minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    # Spaces before ":" can be significant in selectors (".a :hover"), so only trim after it
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    # Keep line breaks (ASI) and never touch comments that could sit inside strings or regexes
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("// "))
+
+
+def _minify_style_attr(m):
+    style = re.sub(r'\s*([;:])\s*', r'\1', m.group(1).strip()).rstrip(';')
+    return f'style="{style}"'
+
+
+def _minify_text(markup):
+    markup = re.sub(r'<!--(?!\[if).*?-->', '', markup, flags=re.S)
+    markup = re.sub(r'>\s*\n\s*<', '><', markup)
+    markup = re.sub(r'\s+', ' ', markup)
+    return re.sub(r'style="([^"]*)"', _minify_style_attr, markup)
+
+
+def minify_html(markup):
+    out, pos = [], 0
+    for m in PROTECTED.finditer(markup):
+        out.append(_minify_text(markup[pos:m.start()]))
+        open_tag, tag, body, close_tag = m.group(1), m.group(2).lower(), m.group(3), m.group(4)
+        if tag == "style": body = minify_css(body)
+        elif tag == "script" and ("type=" not in open_tag or "javascript" in open_tag): body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+        pos = m.end()
+    out.append(_minify_text(markup[pos:]))
+    return "".join(out).strip()
+
+
+MINIFIERS = {".html": minify_html, ".css": minify_css, ".js": minify_js}
+
+
+def _ext(path):
+    return path[path.rfind("."):].lower() if "." in path else ""
+
+
+def _compressed(cache, kind, raw, compress):
+    # Content-addressed: an unchanged file reuses its sidecar from the previous build
+    if cache is None: return compress(raw)
+    key = (kind, hashlib.sha256(raw).digest())
+    data = cache.get(key)
+    if data is None:
+        data = compress(raw)
+        cache.put(key, data)
+    return data
+
+
+def post_process(files, minify=True, precompress=True, cache=None):
+    # Returns the new file map plus a per-file before/after byte report; cache is an archive.BuildCache
+    out, report = {}, []
+    for path, data in files.items():
+        ext = _ext(path)
+        if ext not in TEXT_TYPES or isinstance(data, bytes):
+            out[path] = data
+            continue
+        before = len(data.encode("utf-8"))
+        if minify and ext in MINIFIERS: data = MINIFIERS[ext](data)
+        raw = data.encode("utf-8")
+        out[path] = data
+        row = {"file": path, "original": before, "minified": len(raw), "gzip": None, "brotli": None}
+        if precompress:
+            gz = _compressed(cache, "gzip", raw, lambda b: gzip.compress(b, compresslevel=9, mtime=0))
+            if len(gz) < len(raw): out[path + ".gz"] = gz; row["gzip"] = len(gz)
+            if brotli:
+                br = _compressed(cache, "brotli", raw, lambda b: brotli.compress(b, quality=11))
+                if len(br) < len(raw): out[path + ".br"] = br; row["brotli"] = len(br)
+        report.append(row)
+    return out, report
+
+
+def format_report(report):
+    lines = [f"{'file':40} {'original':>9} {'minified':>9} {'gzip':>8} {'brotli':>8}"]
+    for r in report:
+        lines.append(f"{r['file'][:40]:40} {r['original']:>9} {r['minified']:>9} {r['gzip'] or '-':>8} {r['brotli'] or '-':>8}")
+    total = lambda key: sum(r[key] or 0 for r in report)
+    lines.append(f"{'TOTAL':40} {total('original'):>9} {total('minified'):>9} {total('gzip'):>8} {total('brotli'):>8}")
+    return "\n".join(lines)
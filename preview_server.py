@@ -0,0 +1,263 @@
+"""Local live-preview server with hot section patching.
+
+Serves the built site from memory over plain HTTP, so the preview uses
+the real multi-page links. Every top-level <body> element of a served
+page is tagged with data-titan-node; after a rebuild the server diffs
+each page against the previous build and pushes only the changed nodes
+over server-sent events (/__titan/events). Open pages swap those nodes
+in place and keep their scroll position; a changed <head>, script or
+page structure falls back to a reload that restores the scroll offset.
+schedule() debounces rebuilds, so a burst of edits compiles once.
+"""
+import re
+import json
+import time
+import queue
+import hashlib
+import mimetypes
+import threading
+import urllib.parse
+from collections import OrderedDict
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import engine
+
+DEBOUNCE_S = 0.4
+EVENTS_PATH = "/__titan/events"
+KEEPALIVE_S = 15
+SHEET_INPUTS = ("show_inventory", "prerender_store", "sheet_url", "show_blog", "prerender_blog", "blog_sheet_url")
+BODY_OPEN = re.compile(r'<body\b[^>]*>', re.I)
+
+CLIENT_JS = """<script>(() => {
+    let version = %d;
+    const KEY = 'titan-preview-scroll';
+    const path = decodeURIComponent(location.pathname.slice(1)).replace(/(^|\\/)$/, '$1index.html');
+    const reload = () => { sessionStorage.setItem(KEY, String(scrollY)); location.reload(); };
+    const y = sessionStorage.getItem(KEY);
+    if (y !== null) { sessionStorage.removeItem(KEY); addEventListener('load', () => scrollTo(0, +y)); }
+    const events = new EventSource('/__titan/events');
+    // Sent on every (re)connect: a build that landed while disconnected means this page is stale
+    events.addEventListener('hello', (e) => { if (+e.data !== version) reload(); });
+    events.addEventListener('build', (e) => {
+        const build = JSON.parse(e.data), page = build.pages[path];
+        if (build.base !== version || (page && page.reload)) return reload();
+        version = build.version;
+        for (const [i, hash] of Object.entries(page ? page.nodes : {})) {
+            const old = document.querySelector(`body > [data-titan-node="${i}"]`);
+            if (!old) return reload();
+            const t = document.createElement('template');
+            t.innerHTML = build.html[hash];
+            const fresh = t.content.firstElementChild;
+            old.replaceWith(fresh);
+            if (typeof TitanMotion !== 'undefined') TitanMotion.reveal(fresh);
+            if (typeof TitanFacades !== 'undefined') TitanFacades.scan(fresh);
+        }
+    });
+})();</script>"""
+
+
+class _TopLevel(HTMLParser):
+    # Spans of the top-level elements in a <body>, as character offsets
+    def __init__(self, markup):
+        super().__init__(convert_charrefs=False)
+        self.lines = [0] + [m.end() for m in re.finditer("\n", markup)]
+        self.markup, self.depth, self.spans, self._start = markup, 0, [], None
+
+    def _offset(self):
+        line, col = self.getpos()
+        return self.lines[line - 1] + col
+
+    def handle_starttag(self, tag, attrs):
+        if tag in engine.VOID_TAGS:
+            if self.depth == 0: self.handle_startendtag(tag, attrs)
+            return
+        if self.depth == 0: self._start = (tag, self._offset())
+        self.depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        if self.depth == 0:
+            start = self._offset()
+            self.spans.append((tag, start, start + len(self.get_starttag_text())))
+
+    def handle_endtag(self, tag):
+        if tag in engine.VOID_TAGS or self.depth == 0: return
+        self.depth -= 1
+        if self.depth == 0 and self._start:
+            end = self.markup.index(">", self._offset()) + 1
+            self.spans.append((self._start[0], self._start[1], end))
+            self._start = None
+
+
+def split_page(markup):
+    # (head, [(tag, html)], gaps): everything up to <body>, the top-level elements, and the text between them
+    m = BODY_OPEN.search(markup)
+    close = markup.lower().rfind("</body>")
+    if not m or close < m.end(): return markup, [], []
+    body = markup[m.end():close]
+    parser = _TopLevel(body)
+    parser.feed(body)
+    parser.close()
+    nodes, gaps, last = [], [], 0
+    for i, (tag, start, end) in enumerate(parser.spans):
+        gaps.append(body[last:start])
+        # Tag every top-level element so the client can find it again after a patch
+        nodes.append((tag, f'<{body[start + 1:start + 1 + len(tag)]} data-titan-node="{i}"{body[start + 1 + len(tag):end]}'))
+        last = end
+    gaps.append(body[last:close - m.end()] + markup[close:])
+    return markup[:m.end()], nodes, gaps
+
+
+def diff_page(old, new):
+    # None when a node swap cannot reproduce the new page; else {index: html} of the changed nodes
+    if old[0] != new[0] or old[2] != new[2] or [t for t, _ in old[1]] != [t for t, _ in new[1]]: return None
+    changed = {i: html for i, ((_, a), (tag, html)) in enumerate(zip(old[1], new[1])) if a != html}
+    if any(new[1][i][0] in ("script", "style") or "<script" in html.lower() for i, html in changed.items()): return None
+    return changed
+
+
+def changed_sections(old, new):
+    # Registered generators (engine.SECTIONS) whose declared config inputs differ between two configs
+    if old is None: return sorted(engine.SECTIONS)
+    return sorted(name for name, inputs in engine.SECTIONS.items() if any(getattr(old, k) != getattr(new, k) for k in inputs))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path == EVENTS_PATH: return self.server.preview.stream(self)
+        path = path.lstrip("/")
+        if path == "" or path.endswith("/"): path += "index.html"
+        body = self.server.preview.read(path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PreviewServer:
+    def __init__(self, host="127.0.0.1", port=0, debounce=DEBOUNCE_S):
+        self.host, self.port, self.debounce = host, port, debounce
+        self.files, self.pages, self.version, self.config = {}, {}, 0, None
+        self.status = {"version": 0, "ms": 0.0, "pages": [], "sections": [], "warnings": [], "error": None}
+        self._sections, self._fetched = OrderedDict(), {}
+        self._clients, self._lock, self._build_lock = set(), threading.Lock(), threading.Lock()
+        self._timer, self._httpd, self._pending = None, None, None
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.preview = self
+        self.port = self._httpd.server_port
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._timer: self._timer.cancel()
+        if self._httpd: self._httpd.shutdown()
+
+    def url(self, path=""):
+        return f"http://{self.host}:{self.port}/{path}"
+
+    # --- building ---
+    def schedule(self, c):
+        # The first build is synchronous so the preview has something to show; later ones wait for a quiet spell
+        if not self.version: return self.update(c)
+        # Streamlit reruns on every interaction; an unchanged config needs no build
+        if c == self._pending: return self.status
+        with self._lock:
+            self._pending = c
+            if self._timer: self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self.update, (c,))
+            self._timer.daemon = True
+            self._timer.start()
+        # The last finished build; the scheduled one reports on the next call
+        return self.status
+
+    def _fetch(self, name, inputs, load, c):
+        # Sheets are fetched again only when their URLs or switches change, not on every keystroke
+        key = tuple(getattr(c, k) for k in inputs)
+        if name not in self._fetched or self._fetched[name][0] != key: self._fetched[name] = (key, load(c))
+        return self._fetched[name][1]
+
+    def update(self, c):
+        with self._build_lock:
+            self._pending = c
+            started = time.perf_counter()
+            try:
+                store_items, blog_posts, warnings = self._fetch("sheets", SHEET_INPUTS, engine.load_sheet_data, c)
+                translations, lang_warnings = self._fetch("translations", ("lang_sheet",), engine.load_translations, c)
+                # Pages as build_site renders them; minifying, compression and the audit only matter for the ZIP
+                with engine.section_cache(self._sections): files = engine.build_site(c, store_items, blog_posts, translations=translations)
+            except Exception as e:
+                self.status = {**self.status, "error": f"{type(e).__name__}: {e}"}
+                return self.status
+            pages = {path: split_page(data) for path, data in files.items() if path.endswith(".html")}
+            patches, fragments = {}, {}
+            for path, page in pages.items():
+                old = self.pages.get(path)
+                if old is None or old == page: continue
+                changed = diff_page(old, page)
+                if changed is None:
+                    patches[path] = {"reload": True}
+                    continue
+                nodes = {}
+                for i, html in changed.items():
+                    # Shared fragments (nav, footer, …) change on every page at once: send each distinct one once
+                    key = hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+                    fragments[key], nodes[i] = html, key
+                patches[path] = {"nodes": nodes}
+            with self._lock:
+                base, self.version = self.version, self.version + 1
+                self.files, self.pages = files, pages
+                sections, self.config = changed_sections(self.config, c), c
+                self.status = {"version": self.version, "ms": round((time.perf_counter() - started) * 1000, 1), "pages": sorted(patches),
+                               "sections": sections, "warnings": warnings + lang_warnings, "error": None}
+                if base: self._publish({"base": base, "version": self.version, "pages": patches, "html": fragments})
+            return self.status
+
+    # --- serving ---
+    def read(self, path):
+        with self._lock:
+            if path == "service-worker.js": return None  # a worker would answer from its cache instead of the live build
+            if path in self.pages:
+                head, nodes, gaps = self.pages[path]
+                if not gaps: return head.encode("utf-8")
+                body = "".join(gap + html for gap, (_, html) in zip(gaps, nodes))
+                closing = gaps[-1]
+                at = closing.lower().rfind("</body>")
+                return (head + body + closing[:at] + CLIENT_JS % self.version + closing[at:]).encode("utf-8")
+            data = self.files.get(path)
+        return data.encode("utf-8") if isinstance(data, str) else data
+
+    def _publish(self, event):
+        message = f"event: build\ndata: {json.dumps(event, separators=(',', ':'))}\n\n".encode("utf-8")
+        for q in self._clients: q.put(message)
+
+    def stream(self, handler):
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-store")
+        handler.end_headers()
+        q = queue.Queue()
+        with self._lock:
+            self._clients.add(q)
+            q.put(f"event: hello\ndata: {self.version}\n\n".encode("utf-8"))
+        try:
+            while True:
+                try: message = q.get(timeout=KEEPALIVE_S)
+                except queue.Empty: message = b": keepalive\n\n"
+                handler.wfile.write(message)
+                handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            with self._lock: self._clients.discard(q)
@@ -0,0 +1,103 @@
+"""Build profiler: where the compiler spends its time and where the bytes go.
+
+engine wraps every gen_* generator, get_theme_css() and build_page() with
+timed(); archive reports each ZIP entry. Nothing is recorded unless a
+Profile is active (see profiling()), so normal builds pay one ContextVar
+lookup per call. Profile.report() is what ends up in build-report.json.
+"""
+import re
+import time
+import contextlib
+import contextvars
+
+_active = contextvars.ContextVar("profile", default=None)
+SVG = re.compile(r'<svg\b.*?</svg>', re.S | re.I)
+STYLE_BLOCK = re.compile(r'<style\b[^>]*>.*?</style>', re.S | re.I)
+STYLE_ATTR = re.compile(r'\sstyle="[^"]*"')
+
+
+class Profile:
+    def __init__(self):
+        self.sections, self.stages, self.pages, self.weight = {}, [], {}, None
+        self._stack = []
+
+    def record(self, name, seconds, self_seconds, size):
+        s = self.sections.setdefault(name, {"section": name, "calls": 0, "total_ms": 0.0, "self_ms": 0.0, "bytes": 0})
+        s["calls"] += 1
+        s["total_ms"] += seconds * 1000
+        s["self_ms"] += self_seconds * 1000
+        s["bytes"] += size
+
+    def page(self, path, seconds):
+        self.pages[path] = {"page": path, "ms": seconds * 1000, "bytes": 0}
+
+    def finish(self, files):
+        # Final (minified) sizes; .gz/.br sidecars are alternates of files already counted
+        by_type, svg, css = {}, 0, 0
+        for path, data in files.items():
+            if path.endswith((".gz", ".br")): continue
+            size = len(data.encode("utf-8") if isinstance(data, str) else data)
+            ext = path[path.rfind("."):].lower() if "." in path else ""
+            by_type[ext] = by_type.get(ext, 0) + size
+            if path in self.pages: self.pages[path]["bytes"] = size
+            if ext == ".html":
+                svg += sum(len(m.encode("utf-8")) for m in SVG.findall(data))
+                css += sum(len(m.encode("utf-8")) for m in STYLE_BLOCK.findall(data) + STYLE_ATTR.findall(data))
+        total = sum(by_type.values()) or 1
+        self.weight = {"total": sum(by_type.values()), "by_type": dict(sorted(by_type.items())), "inline_svg": svg, "inline_css": css,
+                       "inline_svg_share": round(svg / total, 4), "inline_css_share": round(css / total, 4)}
+
+    def rows(self):
+        return sorted(({**s, "total_ms": round(s["total_ms"], 2), "self_ms": round(s["self_ms"], 2)} for s in self.sections.values()), key=lambda s: -s["self_ms"])
+
+    def report(self):
+        return {"stages": [{"stage": name, "ms": round(seconds * 1000, 2)} for name, seconds in self.stages],
+                "sections": self.rows(), "pages": [{**p, "ms": round(p["ms"], 2)} for p in self.pages.values()], "weight": self.weight}
+
+
+def current():
+    return _active.get()
+
+
+@contextlib.contextmanager
+def profiling(profile):
+    token = _active.set(profile)
+    try: yield profile
+    finally: _active.reset(token)
+
+
+@contextlib.contextmanager
+def stage(name):
+    profile, start = _active.get(), time.perf_counter()
+    try: yield
+    finally:
+        if profile is not None: profile.stages.append((name, time.perf_counter() - start))
+
+
+def timed(fn):
+    # Inclusive and self time (minus nested timed calls), plus the UTF-8 size of string results
+    def wrapper(*args, **kwargs):
+        profile = _active.get()
+        if profile is None: return fn(*args, **kwargs)
+        profile._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            out = fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = profile._stack.pop()
+            if profile._stack: profile._stack[-1] += elapsed
+        profile.record(fn.__name__, elapsed, elapsed - nested, len(out.encode("utf-8")) if isinstance(out, str) else len(out) if isinstance(out, bytes) else 0)
+        return out
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+
+def format_profile(report, limit=25):
+    lines = [f"{'section':32} {'calls':>6} {'total ms':>9} {'self ms':>9} {'bytes':>10}"]
+    for s in report["sections"][:limit]:
+        lines.append(f"{s['section'][:32]:32} {s['calls']:>6} {s['total_ms']:>9.2f} {s['self_ms']:>9.2f} {s['bytes']:>10}")
+    lines.append("stages: " + ", ".join(f"{s['stage']} {s['ms']:.1f}ms" for s in report["stages"]))
+    w = report["weight"]
+    if w: lines.append(f"weight: {w['total']} bytes, inline SVG {w['inline_svg_share']:.1%}, inline CSS {w['inline_css_share']:.1%}")
+    return "\n".join(lines)
@@ -0,0 +1,64 @@
+"""Persistent, versioned store of client site configurations.
+
+Each project is a directory of immutable snapshots, one JSON file per
+version (projects/<slug>/v0001.json, v0002.json, …), holding the same
+config values the builder's widgets capture and `titan.py build` reads.
+Saving an unchanged config does not add a version. Directories are named
+by slug, so two names that slugify alike are refused rather than merged.
+The root defaults to ./projects and can be moved with TITAN_PROJECTS.
+"""
+import os
+import re
+import json
+import time
+
+import engine
+
+DEFAULT_ROOT = os.environ.get("TITAN_PROJECTS", "projects")
+VERSION_FILE = re.compile(r'^v(\d+)\.json$')
+
+
+class ProjectStore:
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+
+    def _dir(self, name):
+        return os.path.join(self.root, engine.slugify(name))
+
+    def _owner(self, name):
+        # The name the project was saved under, whatever spelling slugified to the same directory
+        versions = self.versions(name)
+        if not versions: return None
+        with open(os.path.join(self._dir(name), f"v{versions[-1]:04d}.json"), encoding="utf-8") as f: return json.load(f)["name"]
+
+    def names(self):
+        if not os.path.isdir(self.root): return []
+        return sorted(filter(None, (self._owner(d) for d in os.listdir(self.root))))
+
+    def versions(self, name):
+        path = self._dir(name)
+        if not os.path.isdir(path): return []
+        return sorted(int(m.group(1)) for m in map(VERSION_FILE.match, os.listdir(path)) if m)
+
+    def load(self, name, version=None):
+        # The full snapshot: {"name", "version", "saved_at", "values"}; latest version by default
+        versions = self.versions(name)
+        if not versions or self._owner(name) != name: raise KeyError(f"No project named {name!r}")
+        version = version or versions[-1]
+        with open(os.path.join(self._dir(name), f"v{version:04d}.json"), encoding="utf-8") as f: return json.load(f)
+
+    def save(self, name, values):
+        # Returns the version holding these values: the latest one if nothing changed, else a new one
+        engine.make_config(values)
+        owner = self._owner(name)
+        # Names share a directory when they slugify alike; a second name must not join another project's history
+        if owner is not None and owner != name: raise ValueError(f"{name!r} clashes with existing project {owner!r} (both stored as {engine.slugify(name)!r})")
+        versions = self.versions(name)
+        if versions and self.load(name)["values"] == values: return versions[-1]
+        version = (versions[-1] if versions else 0) + 1
+        os.makedirs(self._dir(name), exist_ok=True)
+        path = os.path.join(self._dir(name), f"v{version:04d}.json")
+        snapshot = {"name": name, "version": version, "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "values": values}
+        # Exclusive create: two concurrent saves cannot overwrite the same version
+        with open(path, "x", encoding="utf-8") as f: json.dump(snapshot, f, indent=2, ensure_ascii=False)
+        return version
@@ -0,0 +1,47 @@
+"""Site search index for the ZIP.
+
+Builds a compact inverted index over the products, posts, FAQ entries
+and feature pillars of a build. Terms are kept sorted so the client can
+binary-search a prefix and scan forward. Small sites get a single
+search/index.json; past SHARD_TERMS the term lists move to
+search/terms-<first char>.json and a query only loads its own shards.
+"""
+import re
+import json
+import unicodedata
+
+TOKEN = re.compile(r"[a-z0-9]+")
+SHARD_TERMS = 4000
+SNIPPET_CHARS = 90
+
+
+def tokenize(text):
+    # Mirrored by the client: NFKD, strip accents, lowercase, [a-z0-9]+ runs
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode().lower()
+    return TOKEN.findall(text)
+
+
+def _plain(text):
+    return re.sub(r'\s+', ' ', re.sub(r'<[^>]+>|\*\*', ' ', str(text))).strip()
+
+
+def _postings(terms):
+    keys = sorted(terms)
+    return {"k": keys, "d": [sorted(terms[k]) for k in keys]}
+
+
+def build_index(docs):
+    # docs: dicts with title, url, kind and text; returns {path: json} for the ZIP
+    terms, out_docs = {}, []
+    for i, doc in enumerate(docs):
+        text = _plain(doc["text"])
+        out_docs.append({"t": _plain(doc["title"]), "u": doc["url"], "k": doc["kind"], "s": text[:SNIPPET_CHARS]})
+        for token in set(tokenize(f"{doc['title']} {text}")): terms.setdefault(token, set()).add(i)
+    dump = lambda obj: json.dumps(obj, separators=(",", ":"))
+    if len(terms) <= SHARD_TERMS:
+        return {"search/index.json": dump({"docs": out_docs, "shards": None, **_postings(terms)})}
+    shards = {}
+    for token, ids in terms.items(): shards.setdefault(token[0], {})[token] = ids
+    files = {f"search/terms-{ch}.json": dump(_postings(group)) for ch, group in sorted(shards.items())}
+    files["search/index.json"] = dump({"docs": out_docs, "shards": sorted(shards)})
+    return files
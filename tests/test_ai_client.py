@@ -0,0 +1,82 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+import ai_client
+
+ANSWER = {"hero_h": "Bake Better", "hero_sub": "Fresh every morning."}
+
+
+class _FakeOpenAI(BaseHTTPRequestHandler):
+    # Pops one scripted reply per request: ("status", code) or ("stream", [chunks], finished)
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests += 1
+        reply = self.server.script.pop(0)
+        if reply[0] == "status":
+            self.send_response(reply[1])
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for chunk in reply[1]:
+            self.wfile.write(f"data: {json.dumps({'choices': [{'delta': {'content': chunk}}]})}\n\n".encode())
+        if reply[2]: self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAI)
+    server.requests, server.script = 0, []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+
+def _client(fake, tmp_path):
+    return ai_client.AIClient("test-key", base_url=f"http://127.0.0.1:{fake.server_port}/v1", backoff=0, cache_dir=str(tmp_path))
+
+
+def _chunks(text, size=7):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_retries_429_reassembles_stream_and_caches(fake, tmp_path):
+    text = json.dumps(ANSWER)
+    fake.script = [("status", 429), ("stream", _chunks(text), True)]
+    client = _client(fake, tmp_path)
+    deltas = list(client.stream_chat("copy please", json_mode=True))
+    assert len(deltas) > 1 and "".join(deltas) == text
+    assert json.loads(client.chat("copy please", json_mode=True)) == ANSWER
+    assert fake.requests == 2
+
+
+def test_truncated_stream_is_not_cached(fake, tmp_path):
+    text = json.dumps(ANSWER)
+    fake.script = [("stream", _chunks(text[:15]), False), ("stream", _chunks(text), True)]
+    client = _client(fake, tmp_path)
+    assert client.chat("copy please", json_mode=True) == text[:15]
+    assert client.cached("copy please", json_mode=True) is None
+    assert client.chat("copy please", json_mode=True) == text
+    assert fake.requests == 2
+
+
+def test_invalid_json_is_not_cached(fake, tmp_path):
+    fake.script = [("stream", ["not json"], True)]
+    client = _client(fake, tmp_path)
+    assert client.chat("copy please", json_mode=True) == "not json"
+    assert client.cached("copy please", json_mode=True) is None
+
+
+def test_retry_after_is_capped(tmp_path):
+    client = ai_client.AIClient("test-key", cache_dir=str(tmp_path))
+    assert client._delay(0, SimpleNamespace(headers={"Retry-After": "3600"})) == ai_client.MAX_RETRY_AFTER
@@ -0,0 +1,37 @@
+import io
+import zipfile
+
+import archive
+
+FILES = {"index.html": "<p>hello</p>" * 200, "café.css": "body{}", "logo.png": b"\x89PNG" + bytes(range(256)), "empty.txt": b""}
+
+
+def _zip(files, **kwargs):
+    buf = io.BytesIO()
+    archive.write_zip(files, buf, **kwargs)
+    return buf.getvalue()
+
+
+def test_identical_inputs_give_identical_bytes_with_or_without_a_cache():
+    cache = archive.BuildCache()
+    first = _zip(FILES, cache=cache)
+    assert _zip(FILES) == first
+    assert _zip(FILES, cache=cache) == first
+    assert cache.hits and cache.entries
+
+
+def test_round_trip_stores_compressed_formats_and_deflates_text():
+    z = zipfile.ZipFile(io.BytesIO(_zip(FILES)))
+    assert z.testzip() is None
+    methods = {info.filename: info.compress_type for info in z.infolist()}
+    assert methods == {"index.html": zipfile.ZIP_DEFLATED, "café.css": zipfile.ZIP_STORED, "logo.png": zipfile.ZIP_STORED, "empty.txt": zipfile.ZIP_STORED}
+    assert z.read("index.html").decode("utf-8") == FILES["index.html"]
+    assert z.read("logo.png") == FILES["logo.png"]
+
+
+def test_more_than_65535_entries_get_zip64_end_records():
+    files = {f"p/{i}.html": b"" for i in range(70000)}
+    data = _zip(files)
+    assert b"PK\x06\x06" in data[-200:] and b"PK\x06\x07" in data[-200:]
+    z = zipfile.ZipFile(io.BytesIO(data))
+    assert len(z.infolist()) == 70000 and z.testzip() is None
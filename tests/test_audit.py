@@ -0,0 +1,32 @@
+import pytest
+
+import audit
+
+PAGE = """<!DOCTYPE html><html><head><base href="../">
+<link rel="stylesheet" href="assets/site.css"><script src="https://cdn.example.com/a.js"></script><script src="assets/site.js" defer></script>
+<link rel="preconnect" href="https://fonts.gstatic.com"></head><body>
+<img src="img/local.webp" alt="local"><img src="https://images.example.com/a.jpg" alt="remote" loading="lazy">
+<img src="img/sized.webp" width="10" height="10" loading="lazy"><img src="img/ratio.webp" style="aspect-ratio:8/5" fetchpriority="high">
+<noscript><img src="img/fallback.webp"></noscript><template><iframe src="https://www.youtube.com/embed/x"></iframe></template>
+<script>var x = 1;</script></body></html>"""
+FILES = {"assets/site.css": "a" * 3000, "assets/site.css.gz": b"g" * 500, "assets/site.js": "b" * 1000, "img/local.webp": b"i" * 2000}
+
+
+def test_audit_page_counts_each_budget():
+    row = audit.audit_page("blog/post.html", PAGE, {**FILES, "blog/post.html": PAGE}, "https://www.example.com")
+    assert row["render_blocking"] == 2
+    assert row["origins"] == ["https://cdn.example.com", "https://fonts.gstatic.com", "https://images.example.com"]
+    assert row["unsized_images"] == 1 and row["unmeasured_images"] == 1
+    assert row["eager_images"] == 1
+    # The page itself plus the smallest copy of each local resource it references, resolved against <base>
+    assert row["transfer_kb"] == round((len(PAGE) + 500 + 1000 + 2000) / 1000, 1)
+
+
+def test_audit_site_reports_violations_and_rejects_unknown_budgets():
+    files = {**FILES, "blog/post.html": PAGE, "logo.png": b"not a page"}
+    rows, violations = audit.audit_site(files, {"unmeasured_images": 0, "third_party_origins": None})
+    assert [r["page"] for r in rows] == ["blog/post.html"]
+    assert violations == ["blog/post.html: unsized_images 1 > budget 0", "blog/post.html: unmeasured_images 1 > budget 0"]
+    assert audit.audit_site(files, {"render_blocking": 1})[1][0] == "blog/post.html: render_blocking 2 > budget 1"
+    with pytest.raises(ValueError, match="Unknown budget keys"):
+        audit.audit_site(files, {"speed": 1})
@@ -0,0 +1,24 @@
+import engine
+
+CALENDLY = '<div class="calendly-inline-widget" data-url="https://calendly.com/x" style="min-width:320px;height:700px;"></div><script src="https://assets.calendly.com/widget.js" async></script>'
+
+
+def test_embed_height_reads_the_embed_or_falls_back():
+    assert engine.embed_height(CALENDLY, 630) == 700
+    assert engine.embed_height('<iframe src="https://maps.google.com/x" height="300"></iframe>', 450) == 300
+    assert engine.embed_height('<iframe data-min-height="9"></iframe>', 450) == 450
+
+
+def test_facade_keeps_the_embed_inert_until_triggered():
+    out = engine.gen_facade(CALENDLY, "visible", "Load", style="min-height:700px")
+    assert out == f'<div class="facade" data-facade="visible" style="min-height:700px"><template>{CALENDLY}</template><button type="button" class="facade-btn">Load</button></div>'
+
+
+def test_built_pages_only_reference_embeds_inside_templates():
+    c = engine.make_config({"sheet_url": "", "blog_sheet_url": "", "lang_sheet": "", "booking_embed": CALENDLY, "hero_video_id": "abc123",
+                            "map_iframe": '<iframe src="https://maps.google.com/x" height="300"></iframe>'})
+    files = engine.build_site(c)
+    for page, embed in (("booking.html", "assets.calendly.com"), ("index.html", "youtube"), ("contact.html", "maps.google.com/x")):
+        markup = files[page]
+        at = markup.index(embed)
+        assert markup.rfind("<template>", 0, at) > markup.rfind("</template>", 0, at), page
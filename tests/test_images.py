@@ -0,0 +1,69 @@
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import engine
+import images
+
+pytest.importorskip("PIL")
+from PIL import Image
+
+
+def _jpeg(width=2000, height=1000):
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 120, 40)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+class _Fixtures(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.server.fixtures.get(self.path)
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Fixtures)
+    server.fixtures = {"/hero.jpg": _jpeg()}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_optimize_images_writes_variants_fallback_and_lqip(base_url):
+    files, image_map, warnings = images.optimize_images([f"{base_url}/hero.jpg"])
+    meta = image_map[f"{base_url}/hero.jpg"]
+    assert [w for _, w in meta["webp"]] == list(images.DEFAULT_WIDTHS)
+    assert all(files[path][:4] == b"RIFF" for path, _ in meta["webp"])
+    assert meta["fallback"].endswith(".jpg") and files[meta["fallback"]][:2] == b"\xff\xd8"
+    assert (meta["width"], meta["height"]) == (2000, 1000)
+    assert meta["lqip"].startswith("data:image/webp;base64,")
+    assert warnings == []
+
+
+def test_missing_image_stays_hotlinked_with_warning(base_url):
+    files, image_map, warnings = images.optimize_images([f"{base_url}/missing.jpg"])
+    assert files == {} and image_map == {}
+    assert len(warnings) == 1 and "404" in warnings[0] and "missing.jpg" in warnings[0]
+
+
+def test_picture_markup_uses_srcset_and_dimensions(base_url):
+    hero, missing = f"{base_url}/hero.jpg", f"{base_url}/missing.jpg"
+    files, image_map, _ = images.optimize_images([hero, missing])
+    c = engine.with_build_data(engine.make_config({"hero_img_1": hero, "hero_img_2": missing, "hero_img_3": ""}), images=image_map)
+    picture = engine.gen_picture(c, hero, alt="Hero")
+    assert picture.startswith("<picture>") and 'type="image/webp"' in picture
+    assert "srcset=" in picture and "960w" in picture
+    assert 'width="2000" height="1000"' in picture
+    hero_html = engine.gen_hero(c)
+    assert "<picture>" in hero_html and 'fetchpriority="high"' in hero_html
+    assert f"background-image: url('{missing}')" in hero_html
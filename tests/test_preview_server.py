@@ -0,0 +1,43 @@
+import engine
+import preview_server
+
+PAGE = '<html><head><title>t</title></head><body>\n<nav><a href="#">x</a><img src="a.png"></nav>\n<hr>\n<section id="s"><div><p>one</p></div></section>\n<script>go()</script>\n</body></html>'
+
+
+def test_split_page_tags_each_top_level_element_and_keeps_the_gaps():
+    head, nodes, gaps = preview_server.split_page(PAGE)
+    assert head == "<html><head><title>t</title></head><body>"
+    assert [tag for tag, _ in nodes] == ["nav", "hr", "section", "script"]
+    # Void tags inside a node do not open a level; a top-level void tag is a node of its own
+    assert nodes[0][1] == '<nav data-titan-node="0"><a href="#">x</a><img src="a.png"></nav>'
+    assert nodes[1][1] == '<hr data-titan-node="1">'
+    assert gaps == ["\n"] * 4 + ["\n</body></html>"]
+
+
+def test_split_page_without_a_body_is_all_head():
+    assert preview_server.split_page("<p>fragment</p>") == ("<p>fragment</p>", [], [])
+
+
+def test_diff_page_returns_only_changed_nodes():
+    old = preview_server.split_page(PAGE)
+    new = preview_server.split_page(PAGE.replace("<p>one</p>", "<p>two</p>"))
+    assert preview_server.diff_page(old, new) == {2: '<section data-titan-node="2" id="s"><div><p>two</p></div></section>'}
+    assert preview_server.diff_page(old, old) == {}
+
+
+def test_diff_page_falls_back_to_a_reload():
+    old = preview_server.split_page(PAGE)
+    # A changed script, a script inside a changed node, changed text between nodes, a new node or a new head
+    for edit in (("go()", "stop()"), ("<p>one</p>", "<p>one<script>x()</script></p>"), ("\n<hr>", " <hr>"),
+                 ("<hr>", "<hr><hr>"), ("<title>t", "<title>u")):
+        assert preview_server.diff_page(old, preview_server.split_page(PAGE.replace(*edit))) is None, edit
+
+
+def test_schedule_builds_first_then_reports_the_last_finished_build():
+    c = engine.make_config({"sheet_url": "", "blog_sheet_url": "", "lang_sheet": ""})
+    server = preview_server.PreviewServer(debounce=60)
+    status = server.schedule(c)
+    assert status["version"] == 1 and status["error"] is None and "index.html" in server.pages
+    assert server.schedule(engine.make_config({"sheet_url": "", "blog_sheet_url": "", "lang_sheet": "", "hero_h": "New"})) is server.status
+    assert server.version == 1
+    server.stop()
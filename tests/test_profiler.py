@@ -0,0 +1,37 @@
+import json
+
+import engine
+import profiler
+
+
+@profiler.timed
+def inner():
+    return "é" * 10
+
+
+@profiler.timed
+def outer():
+    return inner() + inner()
+
+
+def test_nothing_is_recorded_without_an_active_profile():
+    assert outer() == "é" * 20 and profiler.current() is None
+
+
+def test_timed_counts_calls_bytes_and_self_time():
+    with profiler.profiling(profiler.Profile()) as profile:
+        outer()
+    rows = {r["section"]: r for r in profile.rows()}
+    assert rows["inner"]["calls"] == 2 and rows["inner"]["bytes"] == 40
+    assert rows["outer"]["calls"] == 1 and rows["outer"]["bytes"] == 40
+    # Self time leaves out the nested timed calls
+    assert rows["outer"]["self_ms"] <= rows["outer"]["total_ms"] - rows["inner"]["total_ms"] + 0.01
+
+
+def test_build_report_lists_stages_sections_and_weight():
+    c = engine.make_config({"build_report": True, "sheet_url": "", "blog_sheet_url": "", "lang_sheet": ""})
+    report = json.loads(engine.compile_site(c, offline=True)["files"]["build-report.json"])
+    assert [s["stage"] for s in report["stages"]] == ["sheets", "images", "translations", "pages", "fonts", "post_process", "audit"]
+    assert {"gen_hero", "build_page"} <= {s["section"] for s in report["sections"]}
+    assert "index.html" in {p["page"] for p in report["pages"]}
+    assert report["weight"]["total"] == sum(report["weight"]["by_type"].values())
@@ -0,0 +1,22 @@
+import pytest
+
+import projects
+
+
+def test_names_keep_the_saved_spelling_and_versions_advance(tmp_path):
+    store = projects.ProjectStore(str(tmp_path))
+    assert store.save("Acme Bakery", {"biz_name": "Acme"}) == 1
+    assert store.save("Acme Bakery", {"biz_name": "Acme"}) == 1
+    assert store.save("Acme Bakery", {"biz_name": "Acme & Co"}) == 2
+    assert store.names() == ["Acme Bakery"]
+    assert store.load("Acme Bakery", 1)["values"] == {"biz_name": "Acme"}
+
+
+def test_names_with_the_same_slug_do_not_share_history(tmp_path):
+    store = projects.ProjectStore(str(tmp_path))
+    store.save("Acme Bakery", {"biz_name": "Acme"})
+    with pytest.raises(ValueError, match="clashes"):
+        store.save("acme bakery", {"biz_name": "Other"})
+    with pytest.raises(KeyError):
+        store.load("acme bakery")
+    assert store.versions("Acme Bakery") == [1]
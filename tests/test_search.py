@@ -0,0 +1,34 @@
+import json
+
+import search
+
+
+def _docs(n):
+    return [{"title": "Item", "url": f"product/item-{i}.html", "kind": "Product", "text": f"word{i} <b>bold</b> **strong**"} for i in range(n)]
+
+
+def test_tokenize_folds_accents_and_case():
+    assert search.tokenize("Café CRÈME, 2-in-1") == ["cafe", "creme", "2", "in", "1"]
+
+
+def test_small_sites_get_one_index_with_sorted_terms():
+    files = search.build_index(_docs(3))
+    assert list(files) == ["search/index.json"]
+    index = json.loads(files["search/index.json"])
+    assert index["shards"] is None and index["k"] == sorted(index["k"])
+    assert index["d"][index["k"].index("item")] == [0, 1, 2]
+    assert index["docs"][1] == {"t": "Item", "u": "product/item-1.html", "k": "Product", "s": "word1 bold strong"}
+
+
+def test_sharding_starts_just_past_the_term_limit():
+    # "item", "bold", "strong" plus one wordN term per doc
+    at_limit = search.build_index(_docs(search.SHARD_TERMS - 3))
+    assert list(at_limit) == ["search/index.json"]
+    files = search.build_index(_docs(search.SHARD_TERMS - 2))
+    index = json.loads(files.pop("search/index.json"))
+    assert index["shards"] == ["b", "i", "s", "w"] and "k" not in index
+    assert sorted(files) == [f"search/terms-{ch}.json" for ch in index["shards"]]
+    for ch in index["shards"]:
+        shard = json.loads(files[f"search/terms-{ch}.json"])
+        assert shard["k"] == sorted(shard["k"]) and all(k[0] == ch for k in shard["k"])
+    assert len(json.loads(files["search/terms-w.json"])["k"]) == search.SHARD_TERMS - 2
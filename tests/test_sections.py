@@ -0,0 +1,31 @@
+from collections import OrderedDict
+
+import engine
+
+CONFIG = {"sheet_url": "", "blog_sheet_url": "", "lang_sheet": ""}
+
+
+def test_registered_sections_declare_real_config_inputs():
+    c = engine.make_config()
+    assert {"gen_hero", "gen_nav", "gen_footer"} <= set(engine.SECTIONS)
+    assert all(hasattr(c, key) for inputs in engine.SECTIONS.values() for key in inputs)
+
+
+def test_the_shared_shell_renders_pages_exactly_like_a_per_page_build():
+    c = engine.make_config(CONFIG)
+    assets = engine.gen_site_assets(c)
+    content = engine.gen_text_page("About", c.about_long)
+    shell = engine.gen_page_shell(c, assets)
+    assert engine.build_page(c, "About", content, assets=assets, shell=shell) == engine.build_page(c, "About", content, assets=assets)
+
+
+def test_section_cache_reuses_untouched_sections_across_builds():
+    cache = OrderedDict()
+    with engine.section_cache(cache):
+        first = engine.build_site(engine.make_config(CONFIG))
+        size = len(cache)
+        assert engine.build_site(engine.make_config(CONFIG)) == first and len(cache) == size
+        changed = engine.build_site(engine.make_config({**CONFIG, "hero_h": "Something new"}))
+    assert "Something new" in changed["index.html"]
+    # Only the hero (and the home page that embeds it) render again
+    assert 0 < len(cache) - size <= 3
@@ -0,0 +1,32 @@
+import engine
+
+
+def test_language_columns_become_one_map_each():
+    rows = [["id", "ES", "fr", "en"], ["hero-title", "Hola", "Bonjour", "Hello"], ["cta", "", "Allez", "Go"], ["", "x", "y", "z"]]
+    assert engine.get_translations(rows) == {"es": {"hero-title": "Hola"}, "fr": {"hero-title": "Bonjour", "cta": "Allez"}}
+
+
+def test_a_sheet_without_language_headers_is_read_as_spanish():
+    assert engine.get_translations([["hero-title", "Hola"], ["cta", "Vamos"]]) == {"es": {"hero-title": "Hola", "cta": "Vamos"}}
+    assert engine.get_translations([]) == {}
+
+
+def test_translate_html_replaces_nested_element_text_and_skips_void_tags():
+    markup = '<div id="box"><div>old</div><b>x</b></div><p>keep</p><input id="q" value="v">'
+    out = engine.translate_html(markup, {"box": "Tom & Jerry", "q": "nope", "missing": "?"})
+    assert out == '<div id="box">Tom &amp; Jerry</div><p>keep</p><input id="q" value="v">'
+
+
+def test_localize_links_keeps_page_and_fragment_links_inside_the_copy():
+    markup = ('<a href="about.html">a</a><a href="index.html#faq">b</a><a href="#inventory">c</a><a href="#">d</a>'
+              '<a href="https://x.com/a.html">e</a><a href="missing.html">f</a><link href="assets/site.css">')
+    out = engine.localize_links(markup, "es", {"index.html", "about.html", "blog/post-1.html"}, "blog/post-1.html")
+    assert out == ('<a href="es/about.html">a</a><a href="es/index.html#faq">b</a><a href="es/blog/post-1.html#inventory">c</a>'
+                   '<a href="es/blog/post-1.html#">d</a><a href="https://x.com/a.html">e</a><a href="missing.html">f</a><link href="assets/site.css">')
+
+
+def test_language_copies_link_their_own_sections():
+    c = engine.make_config({"show_inventory": True, "sheet_url": "", "blog_sheet_url": "", "lang_sheet": ""})
+    files = engine.build_site(c, translations={"es": {"missing-id": "x"}})
+    assert 'href="es/index.html#inventory"' in files["es/index.html"]
+    assert 'href="#inventory"' in files["index.html"]
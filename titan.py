@@ -0,0 +1,133 @@
+"""Headless Titan builder.
+
+    python titan.py build site.json -o out/ [--zip site.zip] [--report] [--audit] [--profile] [--offline]
+    python titan.py preview site.json [--port 8000]
+    python titan.py project save "Acme Bakery" site.json | project list
+    python titan.py fleet [--only "acme-*"] [--out dist/] [--jobs 8] [--force]
+
+Reads a site config (JSON or TOML, as exported from the builder's
+"Export site.json" button) and writes the same files as the UI's
+"DOWNLOAD WEBSITE ZIP". preview serves the site locally and patches
+open pages whenever the config file is saved. project keeps versioned
+configs in the project store; fleet rebuilds stored projects in parallel.
+Never imports Streamlit.
+"""
+import argparse
+import os
+import sys
+import time
+
+import audit
+import engine
+import fleet
+import optimize
+import preview_server
+import profiler
+import projects
+
+
+def cmd_build(args):
+    started = time.perf_counter()
+    cfg = engine.load_config(args.config)
+    with profiler.profiling(profiler.Profile() if args.profile else None) as profile:
+        try: result = engine.compile_site(cfg, offline=args.offline)
+        except audit.BudgetExceeded as e:
+            for v in e.violations: print(f"budget: {v}", file=sys.stderr)
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+    for w in result["warnings"]: print(f"warning: {w}", file=sys.stderr)
+    files, store_items, blog_posts = result["files"], result["store_items"], result["blog_posts"]
+    if args.report: print(optimize.format_report(result["size_report"]))
+    if profile: print(profiler.format_profile(profile.report()))
+    if args.audit: print(audit.format_audit(result["audit"]))
+    if args.out: engine.write_dir(files, args.out)
+    if args.zip:
+        with open(args.zip, "wb") as f: engine.write_zip(files, f)
+    print(f"Built {len(files)} files ({len(store_items)} products, {len(blog_posts)} posts) in {time.perf_counter() - started:.3f}s")
+    return 0
+
+
+def cmd_preview(args):
+    server = preview_server.PreviewServer(port=args.port).start()
+    print(f"Previewing {args.config} at {server.url()} (Ctrl+C to stop)")
+    seen, reported = None, None
+    try:
+        while True:
+            mtime = os.stat(args.config).st_mtime_ns
+            if mtime != seen:
+                seen = mtime
+                # A half-saved or invalid config keeps the last good build on screen
+                try: server.schedule(engine.load_config(args.config))
+                except ValueError as e: print(f"error: {e}", file=sys.stderr)
+            if server.status["error"] != reported:
+                reported = server.status["error"]
+                if reported: print(f"error: {reported}", file=sys.stderr)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+def cmd_project(args):
+    store = projects.ProjectStore(args.store)
+    if args.action == "save":
+        try: version = store.save(args.name, engine.config_values(engine.load_config(args.config)))
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        print(f"{args.name}: v{version}")
+    else:
+        for name in store.names():
+            snapshot = store.load(name)
+            print(f"{name:32} v{snapshot['version']:<4} {snapshot['saved_at']}")
+    return 0
+
+
+def cmd_fleet(args):
+    started = time.perf_counter()
+    rows = fleet.run_fleet(projects.ProjectStore(args.store), args.out, args.only, args.jobs, args.force, args.offline,
+                           on_result=lambda row: print(fleet.format_row(row), flush=True))
+    counts = {status: sum(r["status"] == status for r in rows) for status in ("built", "skipped", "failed")}
+    print(f"{counts['built']} built, {counts['skipped']} up to date, {counts['failed']} failed in {time.perf_counter() - started:.1f}s")
+    return 1 if counts["failed"] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="titan", description="Titan static site compiler")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="compile a site config into static files")
+    build.add_argument("config", help="site config (.json or .toml)")
+    build.add_argument("-o", "--out", help="output directory")
+    build.add_argument("--zip", help="also write the site ZIP (identical to the UI download)")
+    build.add_argument("--report", action="store_true", help="print before/after byte counts per file")
+    build.add_argument("--audit", action="store_true", help="print the per-page performance budget audit")
+    build.add_argument("--profile", action="store_true", help="print time, calls and bytes per generator")
+    build.add_argument("--offline", action="store_true", help="skip fetching sheets, images and fonts")
+    build.set_defaults(func=cmd_build)
+    preview = sub.add_parser("preview", help="serve a site config locally, live-patching open pages on save")
+    preview.add_argument("config", help="site config (.json or .toml)")
+    preview.add_argument("--port", type=int, default=8000, help="port to listen on (default 8000)")
+    preview.add_argument("--interval", type=float, default=0.5, help="seconds between config file checks")
+    preview.set_defaults(func=cmd_preview)
+    project = sub.add_parser("project", help="save or list versioned site configs in the project store")
+    project.add_argument("action", choices=("save", "list"))
+    project.add_argument("name", nargs="?", help="project name (save)")
+    project.add_argument("config", nargs="?", help="site config to store (save)")
+    project.add_argument("--store", default=projects.DEFAULT_ROOT, help="project store directory")
+    project.set_defaults(func=cmd_project)
+    rebuild = sub.add_parser("fleet", help="rebuild stored projects in parallel, skipping unchanged ones")
+    rebuild.add_argument("--only", action="append", default=[], help="project name glob (repeatable)")
+    rebuild.add_argument("-o", "--out", default="dist", help="directory for <project>.zip files")
+    rebuild.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    rebuild.add_argument("--force", action="store_true", help="rebuild even when config and engine are unchanged")
+    rebuild.add_argument("--offline", action="store_true", help="skip fetching sheets, images and fonts")
+    rebuild.add_argument("--store", default=projects.DEFAULT_ROOT, help="project store directory")
+    rebuild.set_defaults(func=cmd_fleet)
+    args = parser.parse_args(argv)
+    if args.command == "build" and not (args.out or args.zip): parser.error("build needs -o/--out and/or --zip")
+    if args.command == "project" and args.action == "save" and not (args.name and args.config): parser.error("project save needs a name and a config")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())